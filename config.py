@@ -2,6 +2,7 @@
 unAirplay - Global Configuration
 """
 import socket
+from typing import Optional
 
 # ================= Application Info =================
 APP_NAME = "unAirplay"
@@ -19,19 +20,32 @@ SSDP_MULTICAST_ADDR = "239.255.255.250"
 SSDP_PORT = 1900
 
 
-def get_local_ip():
-    """Get local LAN IP address"""
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
-        return "127.0.0.1"
+_LOCAL_IP: Optional[str] = None
 
 
-LOCAL_IP = get_local_ip()
+def get_local_ip() -> str:
+    """Get local LAN IP address (resolved on first call, then cached)"""
+    global _LOCAL_IP
+    if _LOCAL_IP is None:
+        try:
+            # UDP connect() only selects a route, no packet is sent
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.setblocking(False)
+            try:
+                s.connect(("8.8.8.8", 80))
+                _LOCAL_IP = s.getsockname()[0]
+            finally:
+                s.close()
+        except Exception:
+            _LOCAL_IP = "127.0.0.1"
+    return _LOCAL_IP
+
+
+def __getattr__(name):
+    # LOCAL_IP is resolved lazily, prefer calling get_local_ip() at the point of use
+    if name == "LOCAL_IP":
+        return get_local_ip()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ================= Virtual Device Configuration =================
 # Device name suffix for virtual DLNA devices
@@ -75,6 +89,16 @@ AIRPLAY_SCAN_INTERVAL = 30
 # Timeout for AirPlay device discovery (seconds)
 AIRPLAY_SCAN_TIMEOUT = 5
 
+# Between broad scans, known devices are re-checked by unicast to their last addresses
+# 两次全网扫描之间，通过单播按上次地址复查已知设备
+# A broad scan runs every this many scan cycles
+# 每隔多少个扫描周期进行一次全网扫描
+AIRPLAY_BROAD_SCAN_EVERY = 5
+
+# Timeout for the unicast refresh scan of known devices (seconds)
+# 已知设备单播复查扫描的超时时间（秒）
+AIRPLAY_REFRESH_SCAN_TIMEOUT = 2
+
 # Exclude devices by IP address or name
 # 按IP或名字地址排除设备，例如: ["192.168.1.100", "小喇叭"]
 AIRPLAY_EXCLUDE = []
@@ -85,6 +109,11 @@ AIRPLAY_EXCLUDE = []
 # 设备连续多少次扫描未检测到后，删除虚拟设备
 AIRPLAY_OFFLINE_THRESHOLD = 10
 
+# A device is reported lost only after this many consecutive failed scans (at least 1);
+# a device found again before that is treated as never lost: no disconnected/connected events and no reconnection
+# 设备连续多少次扫描未检测到后才视为丢失（至少为 1）；在此之前重新发现则视为未丢失：不发送断开/连接事件，也不重连
+AIRPLAY_LOST_AFTER_SCANS = 2
+
 # ================= Server Speaker Configuration =================
 # Whether to enable the Server Speaker virtual device (output to the local speaker of the server)
 # After enabling, it will:
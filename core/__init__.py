@@ -1,4 +1,4 @@
 # Core module
 from .utils import log_info, log_debug, log_warning, log_error, set_log_level
-from .event_bus import event_bus, EventBus
+from .event_bus import event_bus, media_bus, discovery_bus, get_bus, EventBus
 from .events import Event, EventType
@@ -6,20 +6,50 @@ ConfigStore - 持久化配置存储
 
 此模块订阅 DSP_CHANGED 事件并自动保存配置。
 """
+import atexit
 import json
+import mmap
 import os
-import copy
-from typing import Dict, Any, Optional
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from .utils import log_info, log_warning, log_debug
-from .event_bus import event_bus
+from .event_bus import event_bus, media_bus
 from .events import EventType, Event
 from config import DEFAULT_DSP_CONFIG
 
+# orjson is optional, serializes in C when available
+# orjson 为可选依赖，可用时使用 C 实现的序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default config file path
 # 默认配置文件路径
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config.json")
 
+# Delay before pending changes are written to disk (seconds)
+# 待写入更改延迟落盘时间（秒）
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # Same layout as orjson (it only indents by 2), so the file doesn't flip format between environments
+    # 与 orjson 保持相同的格式（其仅支持缩进 2），避免切换环境时文件格式来回变化
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data) -> Any:
+    """Parse JSON from bytes or a buffer (e.g. mmap)"""
+    if orjson is not None:
+        return orjson.loads(data if isinstance(data, bytes) else memoryview(data))
+    return json.loads(data if isinstance(data, bytes) else bytes(data))
+
 
 class ConfigStore:
     """
@@ -56,13 +86,27 @@ class ConfigStore:
         self._initialized = True
         self._config_file = CONFIG_FILE
         self._config: Dict[str, Any] = {"devices": {}}
-        self._load()
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()  # held while a snapshot is written to disk
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._last_serialized: Optional[bytes] = None
+        self._device_cache: Dict[str, Dict[str, Any]] = {}  # device_id -> device config
+
+        # Config file is loaded on first access
+        # 配置文件在首次访问时加载
+        self._loaded = False
 
         # Subscribe to DSP changed events for automatic saving
         # 订阅 DSP 更改事件以自动保存
-        event_bus.subscribe(EventType.DSP_CHANGED, self._on_dsp_changed)
+        media_bus.subscribe(EventType.DSP_CHANGED, self._on_dsp_changed)
+        event_bus.subscribe(EventType.SYSTEM_SHUTDOWN, self._on_system_shutdown)
         log_debug("ConfigStore", "Subscribed to DSP_CHANGED events")
 
+        # Make sure pending changes reach the disk on exit
+        # 确保退出时待写入的更改落盘
+        atexit.register(self._flush)
+
     def _on_dsp_changed(self, event: Event):
         """
         Handle DSP configuration change event.
@@ -73,19 +117,47 @@ class ConfigStore:
         enabled = event.data.get("enabled", False)
         config = event.data.get("config", {})
 
-        self.set_device_config(device_id, enabled, config)
+        # Update in memory only, the debounced save coalesces bursts (e.g. slider drags)
+        # 仅更新内存，防抖保存会合并连续的更改（如拖动滑块）
+        entry = {"dsp_enabled": enabled, "dsp_config": dict(config)}
+        with self._lock:
+            self._ensure_loaded()
+            devices = self._config.setdefault("devices", {})
+            if devices.get(device_id) == entry:
+                return
+            devices[device_id] = entry
+            self._device_cache[device_id] = entry
+            self._save()
         log_debug("ConfigStore", f"Auto-saved DSP config for device: {device_id}...")
 
+    def _on_system_shutdown(self, event: Event):
+        """Write pending changes before shutdown"""
+        self._flush()
+
+    def _ensure_loaded(self):
+        """Load configuration from file if not loaded yet"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+                    self._loaded = True
+
     def _load(self):
         """Load configuration from file"""
+        self._device_cache.clear()
         if not os.path.exists(self._config_file):
             log_debug("ConfigStore", f"Config file not found, using defaults")
             self._config = {"devices": {}}
             return
 
         try:
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Parse straight from a read-only mapping, no intermediate read buffer
+            # 直接从只读内存映射解析，避免额外的读取缓冲区
+            with open(self._config_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise ValueError("config file is empty")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = _loads(mm)
                 self._config = data
 
             log_info("ConfigStore", f"Loaded config with {len(self._config.get('devices', {}))} device(s)")
@@ -95,12 +167,50 @@ class ConfigStore:
             self._config = {"devices": {}}
 
     def _save(self):
-        """Save configuration to file
-        保存配置到文件
+        """Mark configuration dirty and schedule a debounced save
+        标记配置已更改并安排防抖保存
+        """
+        with self._lock:
+            self._dirty = True
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self):
+        """Write pending changes to file immediately
+        立即将待写入的更改写入文件
         """
+        # Writers are serialized by _write_lock so an older snapshot never replaces a newer one;
+        # _lock is only held for serializing, so loop-side setters never wait on the disk
+        # 写入由 _write_lock 串行化，避免旧快照覆盖新快照；_lock 仅在序列化时持有，事件循环侧的设置不会等待磁盘
+        with self._write_lock:
+            with self._lock:
+                if self._save_timer:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                data = _dumps(self._config)
+            if data != self._last_serialized:
+                self._write(data)
+
+    def _write(self, data: bytes):
+        """Write serialized configuration to file (blocking, caller holds _write_lock)
+        将序列化后的配置写入文件（阻塞，调用方持有 _write_lock）
+        """
+        # Write to a temp file and rename, so a crash never leaves a truncated config
+        # 先写入临时文件再重命名，避免崩溃时留下不完整的配置文件
+        tmp_file = self._config_file + ".tmp"
         try:
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=4, ensure_ascii=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._config_file)
+            self._last_serialized = data
             log_debug("ConfigStore", "Config saved")
         except Exception as e:
             log_warning("ConfigStore", f"Failed to save config: {e}")
@@ -115,10 +225,28 @@ class ConfigStore:
         Returns:
             Device config dict with dsp_enabled and dsp_config / 包含 dsp_enabled 和 dsp_config 的设备配置字典
         """
-        devices = self._config.get("devices", {})
-        if device_id in devices:
-            return devices[device_id]
-        return None
+        cached = self._device_cache.get(device_id)
+        if cached is not None:
+            return cached
+
+        self._ensure_loaded()
+        config = self._config.get("devices", {}).get(device_id)
+        if config is not None:
+            self._device_cache[device_id] = config
+        return config
+
+    def get_all_device_configs(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get the configs of all devices in one call (loads the file on first use).
+        一次性获取所有设备配置（首次使用时加载文件）。
+
+        Returns:
+            Read-only live view of device_id -> device config, later changes show up in it
+            device_id -> 设备配置 的只读实时视图，后续更改会反映在其中
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return MappingProxyType(self._config.setdefault("devices", {}))
 
     def set_device_config(self, device_id: str, dsp_enabled: bool, dsp_config: Dict[str, Any]):
         """
@@ -130,20 +258,25 @@ class ConfigStore:
             dsp_enabled: Whether DSP is enabled / 是否启用 DSP
             dsp_config: DSP configuration dictionary / DSP 配置字典
         """
-        if "devices" not in self._config:
-            self._config["devices"] = {}
+        entry = {"dsp_enabled": dsp_enabled, "dsp_config": dict(dsp_config)}
+        with self._lock:
+            self._ensure_loaded()
+            if "devices" not in self._config:
+                self._config["devices"] = {}
 
-        self._config["devices"][device_id] = {
-            "dsp_enabled": dsp_enabled,
-            "dsp_config": dsp_config
-        }
-        self._save()
+            if self._config["devices"].get(device_id) == entry:
+                return
+
+            self._config["devices"][device_id] = entry
+            self._device_cache[device_id] = entry
+            self._save()
         log_info("ConfigStore", f"Saved config for device: {device_id}")
 
     def get_dsp_enabled(self, device_id: str) -> bool:
         """Get DSP enabled state for device
         获取设备的 DSP 启用状态
         """
+        self._ensure_loaded()
         config = self.get_device_config(device_id)
         if config:
             return config.get("dsp_enabled", False)
@@ -153,10 +286,13 @@ class ConfigStore:
         """Get DSP config for device
         获取设备的 DSP 配置
         """
+        self._ensure_loaded()
         config = self.get_device_config(device_id)
-        if config:
-            return config.get("dsp_config", copy.deepcopy(DEFAULT_DSP_CONFIG))
-        return copy.deepcopy(DEFAULT_DSP_CONFIG)
+        if config and "dsp_config" in config:
+            return config["dsp_config"]
+        # DEFAULT_DSP_CONFIG is flat, a shallow copy is enough
+        # DEFAULT_DSP_CONFIG 为扁平字典，浅拷贝即可
+        return dict(DEFAULT_DSP_CONFIG)
 
 
 # Global instance
@@ -5,17 +5,47 @@ This module implements the event bus that enables loose coupling between compone
 Components communicate by publishing and subscribing to events.
 """
 import asyncio
-from typing import Callable, Dict, List, Optional, Union
-from collections import defaultdict
+import inspect
+import threading
+import weakref
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from .events import Event, EventType
-from .utils import log_debug, log_warning, log_info
+from .events import Event, EventType, release
+from .utils import log_debug, log_warning, log_info, get_log_level, add_log_level_listener, LOG_LEVEL_DEBUG
 
 
 # Event handler types
 EventHandler = Callable[[Event], None]
 
 
+class _WeakHandler:
+    """Bound method held through a weak reference to its owner"""
+
+    __slots__ = ("ref", "func")
+
+    def __init__(self, ref: weakref.ref, func: Callable):
+        self.ref = ref
+        self.func = func
+
+    def __call__(self) -> Optional[EventHandler]:
+        owner = self.ref()
+        if owner is None:
+            return None
+        return self.func.__get__(owner)
+
+
+# Stored handler: plain callable, or _WeakHandler for bound methods
+HandlerEntry = Union[EventHandler, _WeakHandler]
+
+
+def _deref(entry: HandlerEntry) -> Optional[EventHandler]:
+    """Get the handler behind a stored entry (None if its owner was collected)"""
+    if type(entry) is _WeakHandler:
+        return entry()
+    return entry
+
+
 class EventBus:
     """
     Event Bus - Publish/Subscribe pattern implementation
@@ -25,38 +55,67 @@ class EventBus:
     - Subscribe by event type
     - Subscribe by device ID filter
     - Wildcard subscription (receive all events)
-    - Singleton pattern for global access
+    - Named per-subsystem buses via get_bus(), so each bus only walks
+      the handlers of its own subsystem
+    - Bound methods are held weakly, so subscribers that are never
+      unsubscribed don't leak (their entries are dropped when collected)
+    - Events published from inside a handler are queued and dispatched
+      after the current event, in order, instead of recursively
+    - publish_batched() defers an event to the next loop iteration so
+      the events of one tick go out in a single publish_many
     """
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
+    def __init__(self, name: str = "default"):
+        self.name = name
 
-        # Handlers by event type
-        self._handlers: Dict[EventType, List[EventHandler]] = defaultdict(list)
+        # Handlers by event type, indexed by EventType value
+        self._handlers: List[List[HandlerEntry]] = [
+            [] for _ in range(max(e.value for e in EventType) + 1)
+        ]
 
         # Wildcard handlers (receive all events)
-        self._wildcard_handlers: List[EventHandler] = []
+        self._wildcard_handlers: List[HandlerEntry] = []
 
         # Handlers by device ID + event type
-        self._device_handlers: Dict[str, Dict[EventType, List[EventHandler]]] = defaultdict(lambda: defaultdict(list))
+        self._device_handlers: Dict[str, Dict[EventType, List[HandlerEntry]]] = {}
 
-        # Event loop reference
+        # Resolved handlers, sharded by device ID (None for broadcast events) then event type.
+        # A device (un)subscribe only drops that device's shard; type/wildcard changes drop all
+        self._dispatch_cache: Dict[Optional[str], Dict[EventType, Tuple[HandlerEntry, ...]]] = {}
+
+        # Per-thread queue of events published while a sync publish is dispatching
+        self._pump = threading.local()
+
+        # Events waiting for the next loop iteration (publish_batched)
+        self._batch: deque = deque()
+        self._batch_scheduled = False
+
+        # Event loop reference (set once at startup via set_loop)
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._warned_no_loop = False
+
+        # Skip debug log formatting on the publish path unless DEBUG is enabled
+        self._debug_enabled = get_log_level() <= LOG_LEVEL_DEBUG
+        add_log_level_listener(self._on_log_level_changed)
+
+        log_info("EventBus", f"Event bus initialized: {name}")
+
+    def _on_log_level_changed(self, level: int):
+        """Track whether debug logging is enabled"""
+        self._debug_enabled = level <= LOG_LEVEL_DEBUG
 
-        log_info("EventBus", "Event bus initialized")
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop set at startup (None if not set yet)"""
+        return self._loop
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
-        """Set event loop for async handler execution"""
+        """
+        Set event loop for async handler execution
+
+        Must be called at startup; coroutines returned by handlers of
+        synchronous publish() are scheduled on this loop.
+        """
         self._loop = loop
 
     def subscribe(
@@ -73,17 +132,23 @@ class EventBus:
             handler: Event handler function
             device_id: Optional, only receive events for this device
         """
-        handler_name = getattr(handler, '__name__', str(handler))
+        self._invalidate(event_type, device_id)
+        entry = self._make_entry(event_type, handler, device_id)
 
         if event_type == "*":
-            self._wildcard_handlers.append(handler)
-            log_debug("EventBus", f"Subscribed to ALL events: {handler_name}")
+            self._wildcard_handlers.append(entry)
+            if self._debug_enabled:
+                handler_name = getattr(handler, '__name__', str(handler))
+                log_debug("EventBus", f"Subscribed to ALL events: {handler_name}")
         elif device_id:
-            self._device_handlers[device_id][event_type].append(handler)
-            log_debug("EventBus", f"Subscribed to {event_type.name} for device {device_id}...")
+            self._device_handlers.setdefault(device_id, {}).setdefault(event_type, []).append(entry)
+            if self._debug_enabled:
+                log_debug("EventBus", f"Subscribed to {event_type.name} for device {device_id}...")
         else:
-            self._handlers[event_type].append(handler)
-            log_debug("EventBus", f"Subscribed to {event_type.name}: {handler_name}")
+            self._handlers[event_type.value].append(entry)
+            if self._debug_enabled:
+                handler_name = getattr(handler, '__name__', str(handler))
+                log_debug("EventBus", f"Subscribed to {event_type.name}: {handler_name}")
 
     def unsubscribe(
         self,
@@ -92,21 +157,85 @@ class EventBus:
         device_id: Optional[str] = None
     ):
         """Unsubscribe from events"""
-        try:
-            if event_type == "*":
-                self._wildcard_handlers.remove(handler)
-            elif device_id:
-                self._device_handlers[device_id][event_type].remove(handler)
-            else:
-                self._handlers[event_type].remove(handler)
-        except ValueError:
-            pass
+        entries = self._get_entries(event_type, device_id)
+        for entry in entries:
+            if _deref(entry) == handler:
+                self._remove_entry(event_type, entry, device_id)
+                break
 
     def unsubscribe_device(self, device_id: str):
         """Unsubscribe all handlers for a device"""
         if device_id in self._device_handlers:
             del self._device_handlers[device_id]
-            log_debug("EventBus", f"Unsubscribed all handlers for device {device_id}...")
+            self._dispatch_cache.pop(device_id, None)
+            if self._debug_enabled:
+                log_debug("EventBus", f"Unsubscribed all handlers for device {device_id}...")
+
+    def _make_entry(
+        self,
+        event_type: Union[EventType, str],
+        handler: EventHandler,
+        device_id: Optional[str]
+    ) -> HandlerEntry:
+        """Wrap bound methods in a weak entry that removes itself once the owner is collected"""
+        if not inspect.ismethod(handler):
+            return handler
+
+        def finalizer(_ref: weakref.ref):
+            self._remove_entry(event_type, entry, device_id)
+
+        entry = _WeakHandler(weakref.ref(handler.__self__, finalizer), handler.__func__)
+        return entry
+
+    def _get_entries(self, event_type: Union[EventType, str], device_id: Optional[str]) -> List[HandlerEntry]:
+        """Get the stored handler list for a subscription (without creating it)"""
+        if event_type == "*":
+            return self._wildcard_handlers
+        if device_id:
+            return self._device_handlers.get(device_id, {}).get(event_type, [])
+        return self._handlers[event_type.value]
+
+    def _remove_entry(self, event_type: Union[EventType, str], entry: HandlerEntry, device_id: Optional[str]):
+        """Remove a stored handler entry, dropping empty device tables"""
+        self._invalidate(event_type, device_id)
+        try:
+            self._get_entries(event_type, device_id).remove(entry)
+        except ValueError:
+            return
+
+        if device_id and event_type != "*":
+            device_handlers = self._device_handlers.get(device_id)
+            if device_handlers is not None and not device_handlers.get(event_type):
+                device_handlers.pop(event_type, None)
+                if not device_handlers:
+                    self._device_handlers.pop(device_id, None)
+
+    def _invalidate(self, event_type: Union[EventType, str], device_id: Optional[str]):
+        """Drop the resolved handlers a subscription change affects"""
+        if device_id and event_type != "*":
+            self._dispatch_cache.pop(device_id, None)
+        else:
+            self._dispatch_cache.clear()
+
+    def _resolve_handlers(self, event_type: EventType, device_id: Optional[str]) -> Tuple[HandlerEntry, ...]:
+        """
+        Resolve handlers for an event type and device ID (cached)
+
+        Order: wildcard handlers, event type handlers, device-specific handlers
+        """
+        shard = self._dispatch_cache.get(device_id)
+        if shard is None:
+            shard = self._dispatch_cache[device_id] = {}
+        handlers = shard.get(event_type)
+        if handlers is None:
+            handlers_to_call = list(self._wildcard_handlers)
+            handlers_to_call.extend(self._handlers[event_type.value])
+            if device_id:
+                device_handlers = self._device_handlers.get(device_id, {})
+                handlers_to_call.extend(device_handlers.get(event_type, []))
+            handlers = tuple(handlers_to_call)
+            shard[event_type] = handlers
+        return handlers
 
     def publish(self, event: Event):
         """
@@ -116,93 +245,184 @@ class EventBus:
         1. Wildcard handlers
         2. Event type handlers
         3. Device-specific handlers (if device_id matches)
-        """
-        # Log event publish with trace_id
-        device_info = event.device_id if event.device_id else "global"
-        extra_info = ""
-        if event.type == EventType.STATE_CHANGED:
-            extra_info = f" state={event.data.get('state', '?')}"
-        log_debug("EventBus", f"[{event.trace_id}] Publish: {event.type.name} -> {device_info}{extra_info}")
 
-        handlers_to_call = []
+        The event is returned to the pool afterwards, unless a handler
+        returned a coroutine that still holds it.
+
+        Called from a handler of this bus, the event is queued and
+        dispatched once the current event's handlers have run.
+        """
+        pending = getattr(self._pump, "pending", None)
+        if pending is not None:
+            pending.append(event)
+            return
+        self._run_pump((event,))
 
-        # Collect wildcard handlers
-        handlers_to_call.extend(self._wildcard_handlers)
+    def publish_many(self, events: List[Event]):
+        """
+        Publish a batch of events (synchronous), in order
 
-        # Collect event type handlers
-        handlers_to_call.extend(self._handlers.get(event.type, []))
+        Used to flush events buffered during a burst (e.g. the initial
+        device scan) in one go.
+        """
+        pending = getattr(self._pump, "pending", None)
+        if pending is not None:
+            pending.extend(events)
+            return
+        self._run_pump(events)
 
-        # Collect device-specific handlers
-        if event.device_id:
-            device_handlers = self._device_handlers.get(event.device_id, {})
-            handlers_to_call.extend(device_handlers.get(event.type, []))
+    def publish_batched(self, event: Event):
+        """
+        Publish event on the next event loop iteration
 
-        # Call all handlers
-        for handler in handlers_to_call:
-            try:
-                handler_name = getattr(handler, '__name__', str(handler))
-                log_debug("EventBus", f"[{event.trace_id}] Handle: {event.type.name} -> {handler_name}")
-                result = handler(event)
-                # If coroutine, schedule to event loop
-                if asyncio.iscoroutine(result):
-                    if self._loop and self._loop.is_running():
-                        asyncio.run_coroutine_threadsafe(result, self._loop)
-                    else:
-                        # Try to get current loop
-                        try:
-                            loop = asyncio.get_event_loop()
-                            if loop.is_running():
-                                asyncio.ensure_future(result, loop=loop)
-                            else:
-                                loop.run_until_complete(result)
-                        except RuntimeError:
-                            pass
-            except Exception as e:
-                handler_name = getattr(handler, '__name__', str(handler))
-                log_warning("EventBus", f"[{event.trace_id}] Handler error ({handler_name}): {e}")
+        Events batched during one loop tick (e.g. a DLNA SetAVTransportURI
+        followed by Play) are dispatched together with publish_many, in
+        order. Falls back to publish() before the loop is set.
+        """
+        loop = self._loop
+        if loop is None:
+            self.publish(event)
+            return
+        self._batch.append(event)
+        if self._batch_scheduled:
+            return
+        self._batch_scheduled = True
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            loop.call_soon(self._flush_batch)
+        else:
+            loop.call_soon_threadsafe(self._flush_batch)
+
+    def _flush_batch(self):
+        """Dispatch the events queued by publish_batched (runs on the event loop)"""
+        self._batch_scheduled = False
+        batch = self._batch
+        events = [batch.popleft() for _ in range(len(batch))]
+        if events:
+            self.publish_many(events)
+
+    def _run_pump(self, events):
+        """Dispatch events, then everything their handlers published, until the queue is empty"""
+        self._pump.pending = pending = deque(events)
+        try:
+            while pending:
+                self._collect_and_dispatch(pending.popleft(), async_mode=False)
+        finally:
+            self._pump.pending = None
 
     async def publish_async(self, event: Event):
-        """Publish event (asynchronous)"""
-        # Log event publish with trace_id
-        device_info = event.device_id if event.device_id else "global"
-        extra_info = ""
-        if event.type == EventType.STATE_CHANGED:
-            extra_info = f" state={event.data.get('state', '?')}"
-        log_debug("EventBus", f"[{event.trace_id}] Publish(async): {event.type.name} -> {device_info}{extra_info}")
+        """Publish event (asynchronous), the event is returned to the pool afterwards"""
+        tasks = self._collect_and_dispatch(event, async_mode=True)
 
-        handlers_to_call = []
+        # Execute all async handlers concurrently
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        release(event)
 
-        handlers_to_call.extend(self._wildcard_handlers)
-        handlers_to_call.extend(self._handlers.get(event.type, []))
+    def _collect_and_dispatch(self, event: Event, async_mode: bool) -> Optional[List]:
+        """
+        Call the handlers for an event
 
-        if event.device_id:
-            device_handlers = self._device_handlers.get(event.device_id, {})
-            handlers_to_call.extend(device_handlers.get(event.type, []))
+        Coroutines returned by handlers are collected and returned in async
+        mode, otherwise scheduled on the event loop. In sync mode the event
+        is released here once no scheduled coroutine holds it.
+        """
+        handlers = self._resolve_handlers(event.type, event.device_id)
+        if not handlers:
+            # Nobody is listening
+            if not async_mode:
+                release(event)
+            return None
+
+        debug_enabled = self._debug_enabled
+
+        # Log event publish with trace_id
+        if debug_enabled:
+            device_info = event.device_id if event.device_id else "global"
+            mode = "Publish(async)" if async_mode else "Publish"
+            log_debug("EventBus", f"[{event.trace_id}] {mode}: {event.type.name} -> {device_info}{event._debug_tail()}")
 
-        # Collect async tasks
-        tasks = []
-        for handler in handlers_to_call:
+        # Call all handlers
+        tasks = [] if async_mode else None
+        retained = False
+        for entry in handlers:
+            handler = _deref(entry)
+            if handler is None:
+                continue
             try:
-                handler_name = getattr(handler, '__name__', str(handler))
-                log_debug("EventBus", f"[{event.trace_id}] Handle: {event.type.name} -> {handler_name}")
+                if debug_enabled:
+                    handler_name = getattr(handler, '__name__', str(handler))
+                    log_debug("EventBus", f"[{event.trace_id}] Handle: {event.type.name} -> {handler_name}")
                 result = handler(event)
                 if asyncio.iscoroutine(result):
-                    tasks.append(result)
+                    if async_mode:
+                        tasks.append(result)
+                    else:
+                        # Schedule to event loop, the coroutine keeps using the event
+                        self._schedule(result)
+                        retained = True
             except Exception as e:
                 handler_name = getattr(handler, '__name__', str(handler))
                 log_warning("EventBus", f"[{event.trace_id}] Handler error ({handler_name}): {e}")
 
-        # Execute all async handlers concurrently
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if not async_mode and not retained:
+            release(event)
+        return tasks
+
+    def _schedule(self, coro):
+        """Schedule a coroutine returned by a sync-published handler on the event loop"""
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        else:
+            coro.close()
+            if not self._warned_no_loop:
+                self._warned_no_loop = True
+                log_warning("EventBus", "No event loop set, async handler result dropped (call set_loop at startup)")
 
     def clear(self):
         """Clear all subscriptions"""
-        self._handlers.clear()
+        for handlers in self._handlers:
+            handlers.clear()
         self._wildcard_handlers.clear()
         self._device_handlers.clear()
-        log_info("EventBus", "All subscriptions cleared")
+        self._dispatch_cache.clear()
+        log_info("EventBus", f"All subscriptions cleared: {self.name}")
+
+
+# Named bus registry
+_buses: Dict[str, EventBus] = {}
+
+
+def get_bus(name: str = "default") -> EventBus:
+    """
+    Get the event bus for a subsystem (created on first use)
+
+    New buses inherit the event loop of the default bus.
+    """
+    bus = _buses.get(name)
+    if bus is None:
+        bus = EventBus(name)
+        default_bus = _buses.get("default")
+        if default_bus is not None and default_bus.loop is not None:
+            bus.set_loop(default_bus.loop)
+        _buses[name] = bus
+    return bus
+
+
+def set_bus_loop(loop: asyncio.AbstractEventLoop):
+    """Set event loop on all registered buses"""
+    for bus in _buses.values():
+        bus.set_loop(loop)
+
+
+# Global event bus instance (commands, device lifecycle, system events)
+event_bus = get_bus()
 
+# Playback state and DSP events (STATE_CHANGED, DSP_CHANGED)
+media_bus = get_bus("media")
 
-# Global event bus instance
-event_bus = EventBus()
+# Device discovery events (DEVICE_OFFLINE_THRESHOLD_REACHED)
+discovery_bus = get_bus("discovery")
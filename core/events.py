@@ -4,19 +4,26 @@ Event Definitions - Event types and event factory functions
 This module defines all event types used in the event-driven architecture.
 Events are the primary communication mechanism between components.
 """
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
-from enum import Enum, auto
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from enum import IntEnum, auto
 import time
 import uuid
 
 
+# Shared read-only payload for events without data
+# Handlers must not mutate event.data in place (copy it with dict(event.data) first)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 def generate_trace_id() -> str:
     """Generate a random 8-character trace ID for event tracking"""
     return uuid.uuid4().hex[:8]
 
 
-class EventType(Enum):
+class EventType(IntEnum):
     """Event type enumeration"""
 
     # ===== Command Events =====
@@ -52,7 +59,7 @@ class EventType(Enum):
     SYSTEM_SHUTDOWN = auto()    # System shutdown
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class Event:
     """
     Event base class
@@ -60,28 +67,90 @@ class Event:
     Attributes:
         type: Event type
         device_id: Target device ID (None = broadcast)
-        data: Event data dictionary
-        timestamp: Event creation timestamp
+        data: Event data dictionary (read-only shared empty mapping when the event has no data)
+        timestamp: Event creation time (time.monotonic(), for ordering and intervals only)
         trace_id: 8-character ID for event tracking (auto-generated if not provided)
     """
     type: EventType
-    device_id: Optional[str] = None
-    data: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
-    trace_id: str = field(default_factory=generate_trace_id)
+    device_id: Optional[str]
+    data: Mapping[str, Any]
+    timestamp: float
+    trace_id: str
+    _repr_cache: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        type: EventType,
+        device_id: Optional[str] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        timestamp: Optional[float] = None,
+        trace_id: Optional[str] = None
+    ):
+        # Explicit defaults instead of dataclass default factories (created per command/state change)
+        self.type = type
+        self.device_id = device_id
+        self.data = data if data is not None else _EMPTY
+        self.timestamp = timestamp if timestamp is not None else time.monotonic()
+        self.trace_id = trace_id if trace_id is not None else generate_trace_id()
+        self._repr_cache = None
 
     def __repr__(self):
-        return f"Event({self.type.name}, device={self.device_id if self.device_id else 'all'}..., trace={self.trace_id})"
+        # Built on first use and cached, events are not modified after publishing
+        if self._repr_cache is None:
+            self._repr_cache = f"Event({self.type.name}, device={self.device_id if self.device_id else 'all'}..., trace={self.trace_id})"
+        return self._repr_cache
+
+    def _debug_tail(self) -> str:
+        """Extra detail appended to the debug publish log (built only when DEBUG is enabled)"""
+        if self.type is EventType.STATE_CHANGED:
+            return f" state={self.data.get('state', '?')}"
+        return ""
+
+
+# ===== Event Pool =====
+
+# Maximum number of released events kept for reuse
+EVENT_POOL_SIZE = 64
+
+# Free list of released events, reused by the factories below
+_event_pool: deque = deque(maxlen=EVENT_POOL_SIZE)
+
+
+def _acquire(event_type: EventType, device_id: Optional[str] = None, data: Optional[Mapping[str, Any]] = None) -> Event:
+    """Get an event from the pool (or create one) and fill in its fields"""
+    try:
+        event = _event_pool.pop()
+    except IndexError:
+        return Event(event_type, device_id, data)
+    event.type = event_type
+    event.device_id = device_id
+    event.data = data if data is not None else _EMPTY
+    event.timestamp = time.monotonic()
+    event.trace_id = generate_trace_id()
+    event._repr_cache = None
+    return event
+
+
+def release(event: Event):
+    """
+    Return an event to the pool once all handlers are done with it
+
+    Called by the event bus after dispatch; the event must not be used afterwards.
+    """
+    # Drop payload references so pooled events don't keep them alive
+    event.device_id = None
+    event.data = _EMPTY
+    _event_pool.append(event)
 
 
 # ===== Command Event Factories =====
 
 def cmd_play(device_id: str, url: str, position: float = 0.0, trace_id: str = None, **metadata) -> Event:
     """Create play command event"""
-    event = Event(
-        type=EventType.CMD_PLAY,
-        device_id=device_id,
-        data={"url": url, "position": position, **metadata}
+    event = _acquire(
+        EventType.CMD_PLAY,
+        device_id,
+        {"url": url, "position": position, **metadata}
     )
     if trace_id:
         event.trace_id = trace_id
@@ -90,7 +159,7 @@ def cmd_play(device_id: str, url: str, position: float = 0.0, trace_id: str = No
 
 def cmd_stop(device_id: str, trace_id: str = None) -> Event:
     """Create stop command event"""
-    event = Event(type=EventType.CMD_STOP, device_id=device_id)
+    event = _acquire(EventType.CMD_STOP, device_id)
     if trace_id:
         event.trace_id = trace_id
     return event
@@ -98,7 +167,7 @@ def cmd_stop(device_id: str, trace_id: str = None) -> Event:
 
 def cmd_pause(device_id: str, trace_id: str = None) -> Event:
     """Create pause command event"""
-    event = Event(type=EventType.CMD_PAUSE, device_id=device_id)
+    event = _acquire(EventType.CMD_PAUSE, device_id)
     if trace_id:
         event.trace_id = trace_id
     return event
@@ -106,10 +175,10 @@ def cmd_pause(device_id: str, trace_id: str = None) -> Event:
 
 def cmd_seek(device_id: str, position: float, trace_id: str = None) -> Event:
     """Create seek command event"""
-    event = Event(
-        type=EventType.CMD_SEEK,
-        device_id=device_id,
-        data={"position": position}
+    event = _acquire(
+        EventType.CMD_SEEK,
+        device_id,
+        {"position": position}
     )
     if trace_id:
         event.trace_id = trace_id
@@ -118,10 +187,10 @@ def cmd_seek(device_id: str, position: float, trace_id: str = None) -> Event:
 
 def cmd_set_volume(device_id: str, volume: int, trace_id: str = None) -> Event:
     """Create set volume command event"""
-    event = Event(
-        type=EventType.CMD_SET_VOLUME,
-        device_id=device_id,
-        data={"volume": volume}
+    event = _acquire(
+        EventType.CMD_SET_VOLUME,
+        device_id,
+        {"volume": volume}
     )
     if trace_id:
         event.trace_id = trace_id
@@ -130,10 +199,10 @@ def cmd_set_volume(device_id: str, volume: int, trace_id: str = None) -> Event:
 
 def cmd_set_mute(device_id: str, muted: bool, trace_id: str = None) -> Event:
     """Create set mute command event"""
-    event = Event(
-        type=EventType.CMD_SET_MUTE,
-        device_id=device_id,
-        data={"muted": muted}
+    event = _acquire(
+        EventType.CMD_SET_MUTE,
+        device_id,
+        {"muted": muted}
     )
     if trace_id:
         event.trace_id = trace_id
@@ -142,10 +211,10 @@ def cmd_set_mute(device_id: str, muted: bool, trace_id: str = None) -> Event:
 
 def cmd_set_dsp(device_id: str, enabled: bool, config: dict = None, trace_id: str = None) -> Event:
     """Create DSP configuration command event"""
-    event = Event(
-        type=EventType.CMD_SET_DSP,
-        device_id=device_id,
-        data={"enabled": enabled, "config": config or {}}
+    event = _acquire(
+        EventType.CMD_SET_DSP,
+        device_id,
+        {"enabled": enabled, "config": config or {}}
     )
     if trace_id:
         event.trace_id = trace_id
@@ -154,7 +223,7 @@ def cmd_set_dsp(device_id: str, enabled: bool, config: dict = None, trace_id: st
 
 def cmd_reset_dsp(device_id: str, trace_id: str = None) -> Event:
     """Create reset DSP command event"""
-    event = Event(type=EventType.CMD_RESET_DSP, device_id=device_id)
+    event = _acquire(EventType.CMD_RESET_DSP, device_id)
     if trace_id:
         event.trace_id = trace_id
     return event
@@ -164,28 +233,28 @@ def cmd_reset_dsp(device_id: str, trace_id: str = None) -> Event:
 
 def state_changed(device_id: str, state: str, **extra) -> Event:
     """Create state changed event"""
-    return Event(
-        type=EventType.STATE_CHANGED,
-        device_id=device_id,
-        data={"state": state, **extra}
+    return _acquire(
+        EventType.STATE_CHANGED,
+        device_id,
+        {"state": state, **extra}
     )
 
 
 def position_updated(device_id: str, position: float, duration: float = 0) -> Event:
     """Create position updated event"""
-    return Event(
-        type=EventType.POSITION_UPDATED,
-        device_id=device_id,
-        data={"position": position, "duration": duration}
+    return _acquire(
+        EventType.POSITION_UPDATED,
+        device_id,
+        {"position": position, "duration": duration}
     )
 
 
 def metadata_updated(device_id: str, title: str = "", artist: str = "", album: str = "", cover_url: str = "", duration: float = 0) -> Event:
     """Create metadata updated event"""
-    return Event(
-        type=EventType.METADATA_UPDATED,
-        device_id=device_id,
-        data={
+    return _acquire(
+        EventType.METADATA_UPDATED,
+        device_id,
+        {
             "title": title,
             "artist": artist,
             "album": album,
@@ -197,19 +266,19 @@ def metadata_updated(device_id: str, title: str = "", artist: str = "", album: s
 
 def dsp_changed(device_id: str, enabled: bool, config: dict = None) -> Event:
     """Create DSP changed event"""
-    return Event(
-        type=EventType.DSP_CHANGED,
-        device_id=device_id,
-        data={"enabled": enabled, "config": config or {}}
+    return _acquire(
+        EventType.DSP_CHANGED,
+        device_id,
+        {"enabled": enabled, "config": config or {}}
     )
 
 
 def volume_changed(device_id: str, volume: int, muted: bool = False) -> Event:
     """Create volume changed event"""
-    return Event(
-        type=EventType.VOLUME_CHANGED,
-        device_id=device_id,
-        data={"volume": volume, "muted": muted}
+    return _acquire(
+        EventType.VOLUME_CHANGED,
+        device_id,
+        {"volume": volume, "muted": muted}
     )
 
 
@@ -217,34 +286,34 @@ def volume_changed(device_id: str, volume: int, muted: bool = False) -> Event:
 
 def device_added(device_id: str, device_info: dict) -> Event:
     """Create device added event"""
-    return Event(
-        type=EventType.DEVICE_ADDED,
-        device_id=device_id,
-        data=device_info
+    return _acquire(
+        EventType.DEVICE_ADDED,
+        device_id,
+        device_info
     )
 
 
 def device_removed(device_id: str) -> Event:
     """Create device removed event"""
-    return Event(type=EventType.DEVICE_REMOVED, device_id=device_id)
+    return _acquire(EventType.DEVICE_REMOVED, device_id)
 
 
 def device_connected(device_id: str) -> Event:
     """Create device connected event"""
-    return Event(type=EventType.DEVICE_CONNECTED, device_id=device_id)
+    return _acquire(EventType.DEVICE_CONNECTED, device_id)
 
 
 def device_disconnected(device_id: str) -> Event:
     """Create device disconnected event"""
-    return Event(type=EventType.DEVICE_DISCONNECTED, device_id=device_id)
+    return _acquire(EventType.DEVICE_DISCONNECTED, device_id)
 
 
 def device_offline_threshold_reached(airplay_id: str) -> Event:
     """Create device offline threshold reached event (triggers virtual device removal)"""
-    return Event(
-        type=EventType.DEVICE_OFFLINE_THRESHOLD_REACHED,
-        device_id=None,  # Using airplay_id in data, not device_id
-        data={"airplay_id": airplay_id}
+    return _acquire(
+        EventType.DEVICE_OFFLINE_THRESHOLD_REACHED,
+        None,  # Using airplay_id in data, not device_id
+        {"airplay_id": airplay_id}
     )
 
 
@@ -252,9 +321,9 @@ def device_offline_threshold_reached(airplay_id: str) -> Event:
 
 def system_startup() -> Event:
     """Create system startup event"""
-    return Event(type=EventType.SYSTEM_STARTUP)
+    return _acquire(EventType.SYSTEM_STARTUP)
 
 
 def system_shutdown() -> Event:
     """Create system shutdown event"""
-    return Event(type=EventType.SYSTEM_SHUTDOWN)
+    return _acquire(EventType.SYSTEM_SHUTDOWN)
@@ -8,42 +8,98 @@ Checks if FFmpeg is installed and accessible in the system PATH.
 import subprocess
 import shutil
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
+from core.ffmpeg_utils import FFMPEG_EXE, SUBPROCESS_KWARGS
 from core.utils import log_info, log_warning, log_error
 
-
-def get_ffmpeg_version() -> Tuple[bool, Optional[str], Optional[str]]:
+# Version number in the first line of `ffmpeg -version`
+# `ffmpeg -version` 第一行中的版本号
+_FFMPEG_VERSION_RE = re.compile(r'ffmpeg version (\S+)')
+
+# Installation help shown when FFmpeg is missing (logged as one message)
+# 未找到 FFmpeg 时显示的安装帮助（作为一条日志输出）
+_HELP_TEXT = """
+
+============================================================
+  FFmpeg is required but not found!
+  FFmpeg 是必需的，但未找到！
+============================================================
+
+Windows:
+  Option 1: winget install ffmpeg
+  Option 2: Manual install
+    1. Download from https://ffmpeg.org/download.html
+    2. Extract to installation directory (e.g., C:\\Program Files\\ffmpeg)
+    3. Add the bin folder to system PATH
+       (System Properties -> Environment Variables -> Path -> New)
+  方式1: winget install ffmpeg
+  方式2: 手动安装
+    1. 下载: https://ffmpeg.org/download.html
+    2. 解压到安装目录（如: C:\\Program Files\\ffmpeg）
+    3. 将 bin 文件夹添加到系统环境变量 PATH
+       (系统属性 -> 环境变量 -> Path -> 新建)
+
+Linux: sudo apt install ffmpeg
+macOS: brew install ffmpeg
+
+============================================================"""
+
+# Set once the availability result has been logged
+# 可用性结果已输出日志后置位
+_checked = False
+
+
+@lru_cache(maxsize=1)
+def _probe_ffmpeg() -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
     """
-    Get FFmpeg version information
-    获取 FFmpeg 版本信息
+    Run `ffmpeg -version` once per process
+    每个进程只执行一次 `ffmpeg -version`
 
     Returns:
-        (is_available, version_string, version_number)
-        (是否可用, 版本字符串, 版本号如 "6.0")
+        (is_available, version_line, version_number, error)
     """
-    ffmpeg_path = shutil.which("ffmpeg")
+    ffmpeg_path = shutil.which(FFMPEG_EXE)
     if not ffmpeg_path:
-        return False, None, None
+        return False, None, None, "FFmpeg not found in system PATH"
 
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            [FFMPEG_EXE, "-version"],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=5,
+            **SUBPROCESS_KWARGS
         )
         if result.returncode == 0:
             version_line = result.stdout.split('\n')[0]
             # 提取版本号，支持多种格式：
             # "ffmpeg version 6.0" -> "6.0"
             # "ffmpeg version N-122571-g4ad20a2c09" -> "N-122571"
-            match = re.search(r'ffmpeg version (\S+)', version_line)
+            match = _FFMPEG_VERSION_RE.search(version_line)
             version_num = match.group(1) if match else None
-            return True, version_line, version_num
-        return False, None, None
-    except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-        return False, None, None
+            return True, version_line, version_num, None
+        return False, None, None, "FFmpeg found but failed to get version"
+    except FileNotFoundError:
+        return False, None, None, "FFmpeg not found in system PATH"
+    except subprocess.TimeoutExpired:
+        return False, None, None, "FFmpeg check timed out"
+    except Exception as e:
+        return False, None, None, f"FFmpeg check failed: {e}"
+
+
+def get_ffmpeg_version() -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Get FFmpeg version information (cached for the process lifetime)
+    获取 FFmpeg 版本信息（进程内缓存）
+
+    Returns:
+        (is_available, version_string, version_number)
+        (是否可用, 版本字符串, 版本号如 "6.0")
+    """
+    is_available, version_line, version_num, _ = _probe_ffmpeg()
+    return is_available, version_line, version_num
 
 
 def check_ffmpeg() -> Tuple[bool, Optional[str]]:
@@ -55,28 +111,10 @@ def check_ffmpeg() -> Tuple[bool, Optional[str]]:
         (is_available, version_or_error)
         (是否可用, 版本号或错误信息)
     """
-    ffmpeg_path = shutil.which("ffmpeg")
-    if not ffmpeg_path:
-        return False, "FFmpeg not found in system PATH"
-
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            version_line = result.stdout.split('\n')[0]
-            return True, version_line
-        else:
-            return False, "FFmpeg found but failed to get version"
-    except FileNotFoundError:
-        return False, "FFmpeg not found in system PATH"
-    except subprocess.TimeoutExpired:
-        return False, "FFmpeg check timed out"
-    except Exception as e:
-        return False, f"FFmpeg check failed: {e}"
+    is_available, version_line, _, error = _probe_ffmpeg()
+    if is_available:
+        return True, version_line
+    return False, error
 
 
 def check_ffmpeg_or_exit(tag: str = "Startup"):
@@ -87,37 +125,17 @@ def check_ffmpeg_or_exit(tag: str = "Startup"):
     Args:
         tag: Log tag / 日志标签
     """
+    global _checked
     is_available, info = check_ffmpeg()
 
     if is_available:
-        log_info(tag, f"FFmpeg: {info}")
+        if not _checked:
+            _checked = True
+            log_info(tag, f"FFmpeg: {info}")
         return True
 
     log_error(tag, f"FFmpeg check failed: {info}")
-    log_error(tag, "")
-    log_error(tag, "=" * 60)
-    log_error(tag, "  FFmpeg is required but not found!")
-    log_error(tag, "  FFmpeg 是必需的，但未找到！")
-    log_error(tag, "=" * 60)
-    log_error(tag, "")
-    log_error(tag, "Windows:")
-    log_error(tag, "  Option 1: winget install ffmpeg")
-    log_error(tag, "  Option 2: Manual install")
-    log_error(tag, "    1. Download from https://ffmpeg.org/download.html")
-    log_error(tag, "    2. Extract to installation directory (e.g., C:\\Program Files\\ffmpeg)")
-    log_error(tag, "    3. Add the bin folder to system PATH")
-    log_error(tag, "       (System Properties -> Environment Variables -> Path -> New)")
-    log_error(tag, "  方式1: winget install ffmpeg")
-    log_error(tag, "  方式2: 手动安装")
-    log_error(tag, "    1. 下载: https://ffmpeg.org/download.html")
-    log_error(tag, "    2. 解压到安装目录（如: C:\\Program Files\\ffmpeg）")
-    log_error(tag, "    3. 将 bin 文件夹添加到系统环境变量 PATH")
-    log_error(tag, "       (系统属性 -> 环境变量 -> Path -> 新建)")
-    log_error(tag, "")
-    log_error(tag, "Linux: sudo apt install ffmpeg")
-    log_error(tag, "macOS: brew install ffmpeg")
-    log_error(tag, "")
-    log_error(tag, "=" * 60)
+    log_error(tag, _HELP_TEXT)
 
     import sys
     sys.exit(1)
@@ -135,10 +153,13 @@ def check_ffmpeg_with_warning(tag: str = "FFmpegCheck") -> bool:
         True if available, False otherwise
         如果可用返回 True，否则返回 False
     """
+    global _checked
     is_available, info = check_ffmpeg()
 
     if is_available:
-        log_info(tag, f"FFmpeg: {info}")
+        if not _checked:
+            _checked = True
+            log_info(tag, f"FFmpeg: {info}")
         return True
     else:
         log_warning(tag, f"FFmpeg not available: {info}")
@@ -13,11 +13,15 @@ from typing import Optional
 
 from config import SAMPLE_RATE, CHANNELS
 
-from core.ffmpeg_utils import PCMFormat, get_subprocess_kwargs, terminate_process
+from core.ffmpeg_utils import PCMFormat, FFMPEG_EXE, get_subprocess_kwargs, terminate_process
 from core.utils import log_info, log_debug, log_error
 
+# Initial size of the reusable read buffer (grown on demand)
+# 可复用读取缓冲区的初始大小（按需扩大）
+READ_BUFFER_SIZE = 65536
 
-@dataclass
+
+@dataclass(slots=True)
 class DecoderConfig:
     """
     Decoder configuration
@@ -56,6 +60,34 @@ class FFmpegDecoder:
         self._device_name = device_name
         self._process: Optional[subprocess.Popen] = None
         self._started = False
+        self._buf = bytearray(READ_BUFFER_SIZE)
+        self._mv = memoryview(self._buf)
+
+        # Resolved once from the config / 从配置中一次性解析
+        pcm_format = config.pcm_format
+        self._bytes_per_frame = config.channels * pcm_format.bytes_per_sample
+
+        # Command line around the input source, fixed by the config
+        # 输入源前后的命令行参数，由配置决定
+        cmd_prefix = [FFMPEG_EXE]
+        # Quiet mode / 静默模式
+        if config.quiet:
+            cmd_prefix += ("-hide_banner", "-loglevel", "error")
+        # Seek position / Seek 位置
+        if config.seek_position > 0:
+            cmd_prefix += ("-ss", str(config.seek_position))
+        # Realtime playback rate / 实时播放速率
+        if config.realtime:
+            cmd_prefix.append("-re")
+        self._cmd_prefix: tuple[str, ...] = tuple(cmd_prefix)
+        self._cmd_suffix: tuple[str, ...] = (
+            "-vn",  # No video / 无视频
+            "-acodec", pcm_format.codec,
+            "-ar", str(config.sample_rate),
+            "-ac", str(config.channels),
+            "-f", pcm_format.format,
+            "pipe:1"  # Output to stdout / 输出到 stdout
+        )
 
     @property
     def process(self) -> Optional[subprocess.Popen]:
@@ -87,7 +119,7 @@ class FFmpegDecoder:
         Bytes per frame (channels * bytes_per_sample)
         每帧字节数 (channels * bytes_per_sample)
         """
-        return self._config.channels * self._config.pcm_format.bytes_per_sample
+        return self._bytes_per_frame
 
     def start(self, input_source: str) -> subprocess.Popen:
         """
@@ -103,30 +135,7 @@ class FFmpegDecoder:
         if self._started:
             return self._process
 
-        cmd = ["ffmpeg"]
-
-        # Quiet mode / 静默模式
-        if self._config.quiet:
-            cmd.extend(["-hide_banner", "-loglevel", "error"])
-
-        # Seek position / Seek 位置
-        if self._config.seek_position > 0:
-            cmd.extend(["-ss", str(self._config.seek_position)])
-
-        # Realtime playback rate / 实时播放速率
-        if self._config.realtime:
-            cmd.append("-re")
-
-        # Input and output settings / 输入和输出设置
-        cmd.extend([
-            "-i", input_source,
-            "-vn",  # No video / 无视频
-            "-acodec", self._config.pcm_format.codec,
-            "-ar", str(self._config.sample_rate),
-            "-ac", str(self._config.channels),
-            "-f", self._config.pcm_format.format,
-            "pipe:1"  # Output to stdout / 输出到 stdout
-        ])
+        cmd = [*self._cmd_prefix, "-i", input_source, *self._cmd_suffix]
 
         log_debug("FFmpeg Decoder", f"{self._device_name}: Starting decoder: {self._config.pcm_format.name}, "
                  f"rate={self._config.sample_rate}, channels={self._config.channels}" +
@@ -178,5 +187,31 @@ class FFmpegDecoder:
             return b""
         try:
             return self._process.stdout.read(size)
-        except:
+        except (OSError, ValueError):
             return b""
+
+    def read_into(self, size: int) -> memoryview:
+        """
+        Read PCM data into the decoder's reusable buffer
+        读取 PCM 数据到解码器的可复用缓冲区
+
+        The returned view is only valid until the next read_into() call,
+        copy it if it has to be kept.
+        返回的视图仅在下一次 read_into() 调用前有效，需要保留时请复制。
+
+        Args:
+            size: Number of bytes to read / 要读取的字节数
+
+        Returns:
+            View of the PCM data, empty if EOF or error / PCM 数据视图，如果 EOF 或错误则为空
+        """
+        if not self._process or not self._process.stdout:
+            return self._mv[:0]
+        if size > len(self._buf):
+            self._buf = bytearray(size)
+            self._mv = memoryview(self._buf)
+        try:
+            n = self._process.stdout.readinto(self._mv[:size])
+        except (OSError, ValueError):
+            return self._mv[:0]
+        return self._mv[:n or 0]
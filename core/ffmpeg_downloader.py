@@ -10,14 +10,23 @@ Supports download-while-play scenarios.
 import os
 import subprocess
 import threading
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
-from core.ffmpeg_utils import get_subprocess_kwargs, terminate_process
+from core.ffmpeg_utils import FFMPEG_EXE, SUBPROCESS_KWARGS, terminate_process
 from core.utils import log_info, log_debug, log_warning, log_error
 
+# Number of trailing stderr lines kept for error reporting
+# 保留用于错误报告的 stderr 末尾行数
+STDERR_TAIL_LINES = 32
 
-@dataclass
+# Interval for checking process exit / cancellation (seconds)
+# 检查进程退出/取消的间隔（秒）
+POLL_INTERVAL = 0.2
+
+
+@dataclass(slots=True)
 class DownloaderConfig:
     """
     Downloader configuration
@@ -59,6 +68,10 @@ class FFmpegDownloader:
         self._error: Optional[str] = None
         self._downloading = False
         self._seek_position = 0.0  # Download start position (for Seek scenarios) / 下载起始位置（用于 Seek 场景）
+        self._file_path = os.path.join(
+            config.cache_dir,
+            f"{config.cache_filename}.{config.file_extension}"
+        )
 
     @property
     def file_path(self) -> str:
@@ -66,10 +79,7 @@ class FFmpegDownloader:
         Full path to cache file
         缓存文件完整路径
         """
-        return os.path.join(
-            self._config.cache_dir,
-            f"{self._config.cache_filename}.{self._config.file_extension}"
-        )
+        return self._file_path
 
     @property
     def is_downloading(self) -> bool:
@@ -109,8 +119,8 @@ class FFmpegDownloader:
         获取当前缓存文件大小（字节）
         """
         try:
-            return os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
-        except:
+            return os.stat(self._file_path).st_size
+        except OSError:
             return 0
 
     def start(self, url: str, seek_position: float = 0.0):
@@ -190,7 +200,7 @@ class FFmpegDownloader:
         log_debug("FFmpeg Downloader", f"[{self._device_name}] URL: {url}")
         log_debug("FFmpeg Downloader", f"[{self._device_name}] Cache file: {self.file_path}")
 
-        cmd = ["ffmpeg", "-y"]  # Overwrite existing file / 覆盖已存在文件
+        cmd = [FFMPEG_EXE, "-y"]  # Overwrite existing file / 覆盖已存在文件
 
         # Start download from specified position (for Seek scenarios) / 从指定位置开始下载（用于 Seek 场景）
         if seek_position > 0:
@@ -210,15 +220,33 @@ class FFmpegDownloader:
                 stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                **get_subprocess_kwargs()
+                **SUBPROCESS_KWARGS
             )
 
             # Keep local reference to avoid race condition with stop()
             # 保存本地引用以避免与 stop() 的竞态条件
             process = self._process
 
-            # Wait for process to complete / 等待进程完成
-            _, stderr = process.communicate()
+            # Drain stderr in a helper thread, keeping only the tail for error reporting
+            # 在辅助线程中读取 stderr，仅保留末尾用于错误报告
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            stderr_thread = threading.Thread(
+                target=self._drain_stderr,
+                args=(process.stderr, stderr_tail),
+                daemon=True
+            )
+            stderr_thread.start()
+
+            # Wait for process to complete, stop early if cancelled / 等待进程完成，被取消时提前结束
+            while True:
+                try:
+                    process.wait(timeout=POLL_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    if not self._downloading:
+                        terminate_process(process)
+                        break
+            stderr_thread.join(timeout=1)
 
             if not self._downloading:
                 # Manually stopped / 被手动停止
@@ -231,7 +259,8 @@ class FFmpegDownloader:
                 file_size = self.get_file_size()
                 log_debug("FFmpeg Downloader", f"[{self._device_name}] Download completed: {file_size // 1024}KB")
             else:
-                error_msg = stderr.decode("utf-8", errors="ignore")[:200] if stderr else "Unknown error"
+                stderr = b"".join(stderr_tail)
+                error_msg = stderr.decode("utf-8", errors="ignore")[-200:].strip() if stderr else "Unknown error"
                 self._error = error_msg
                 log_error("FFmpeg Downloader", f"[{self._device_name}] Download failed (exit code {exit_code}): {error_msg}")
 
@@ -244,3 +273,15 @@ class FFmpegDownloader:
             self._downloading = False
 
         log_debug("FFmpeg Downloader", f"[{self._device_name}] Download thread ended")
+
+    @staticmethod
+    def _drain_stderr(stream, tail: deque):
+        """
+        Read FFmpeg stderr until EOF, keeping the last lines
+        读取 FFmpeg stderr 直到 EOF，保留最后若干行
+        """
+        try:
+            for line in iter(stream.readline, b""):
+                tail.append(line)
+        except (OSError, ValueError):
+            pass
@@ -5,10 +5,39 @@ FFmpeg 公共工具
 Provides PCM format definitions and process management utility functions.
 提供 PCM 格式定义和进程管理工具函数。
 """
+import shutil
 import subprocess
 import sys
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
+
+import numpy as np
+
+# numba is optional, JIT-compiles the PCM sample conversions when available
+# numba 为可选依赖，可用时对 PCM 采样转换进行 JIT 编译
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Executable paths, resolved from PATH once at import (bare name if not found)
+# 可执行文件路径，导入时从 PATH 解析一次（未找到时使用命令名）
+FFMPEG_EXE = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE_EXE = shutil.which("ffprobe") or "ffprobe"
+
+# Platform-specific subprocess parameters, fixed for the process lifetime (do not mutate)
+# 平台相关的 subprocess 参数，进程内不变（请勿修改）
+SUBPROCESS_KWARGS: Dict[str, Any] = (
+    {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+)
+
+
+class _FmtSpec(NamedTuple):
+    """PCMFormat member value / PCMFormat 成员值"""
+    codec: str
+    fmt: str
+    bps: int
+    np_dtype: str
 
 
 class PCMFormat(Enum):
@@ -16,8 +45,8 @@ class PCMFormat(Enum):
     PCM output format
     PCM 输出格式
     """
-    S16LE = ("pcm_s16le", "s16le", 2, "int16")    # 16-bit signed (AirPlay)
-    F32LE = ("pcm_f32le", "f32le", 4, "float32")  # 32-bit float (ServerSpeaker)
+    S16LE = _FmtSpec("pcm_s16le", "s16le", 2, "int16")    # 16-bit signed (AirPlay)
+    F32LE = _FmtSpec("pcm_f32le", "f32le", 4, "float32")  # 32-bit float (ServerSpeaker)
 
     @property
     def codec(self) -> str:
@@ -25,7 +54,7 @@ class PCMFormat(Enum):
         FFmpeg codec name
         FFmpeg codec 名称
         """
-        return self.value[0]
+        return self.value.codec
 
     @property
     def format(self) -> str:
@@ -33,7 +62,7 @@ class PCMFormat(Enum):
         FFmpeg output format
         FFmpeg 输出格式
         """
-        return self.value[1]
+        return self.value.fmt
 
     @property
     def bytes_per_sample(self) -> int:
@@ -41,7 +70,7 @@ class PCMFormat(Enum):
         Bytes per sample
         每个采样的字节数
         """
-        return self.value[2]
+        return self.value.bps
 
     @property
     def numpy_dtype(self) -> str:
@@ -49,18 +78,75 @@ class PCMFormat(Enum):
         Corresponding numpy dtype
         对应的 numpy dtype
         """
-        return self.value[3]
+        return self.value.np_dtype
+
+    def to_f32(self, data) -> np.ndarray:
+        """
+        Convert PCM bytes in this format to a 1-D float32 array in [-1, 1]
+        将此格式的 PCM 字节转换为 [-1, 1] 范围的一维 float32 数组
+        """
+        if self is PCMFormat.S16LE:
+            return s16_to_f32(data)
+        return np.frombuffer(data, dtype=np.float32)
+
+
+if numba is not None:
+    # Signatures cover read-only input (np.frombuffer on bytes), compiled at import and cached on disk
+    # 签名覆盖只读输入（bytes 上的 np.frombuffer），导入时编译并缓存到磁盘
+    def _signatures(src_dtype, dst_dtype):
+        return [
+            numba.void(numba.types.Array(src_dtype, 1, "C", readonly=True), dst_dtype[::1]),
+            numba.void(src_dtype[::1], dst_dtype[::1]),
+        ]
+
+    @numba.njit(_signatures(numba.int16, numba.float32), cache=True, fastmath=True)
+    def _s16_to_f32_kernel(src, dst):
+        for i in range(src.size):
+            dst[i] = src[i] * np.float32(1.0 / 32768.0)
+
+    @numba.njit(_signatures(numba.float32, numba.int16), cache=True, fastmath=True)
+    def _f32_to_s16_kernel(src, dst):
+        for i in range(src.size):
+            v = src[i]
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            dst[i] = np.int16(v * np.float32(32767.0))
+
+
+def s16_to_f32(data) -> np.ndarray:
+    """
+    Convert S16LE PCM bytes to a 1-D float32 array in [-1, 1]
+    将 S16LE PCM 字节转换为 [-1, 1] 范围的一维 float32 数组
+    """
+    src = np.frombuffer(data, dtype=np.int16)
+    if numba is None:
+        return src.astype(np.float32) / np.float32(32768.0)
+    dst = np.empty(src.size, dtype=np.float32)
+    _s16_to_f32_kernel(src, dst)
+    return dst
+
+
+def f32_to_s16(samples: np.ndarray) -> bytes:
+    """
+    Clip float samples to [-1, 1] and convert to S16LE PCM bytes
+    将浮点采样裁剪到 [-1, 1] 并转换为 S16LE PCM 字节
+    """
+    if numba is None:
+        return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+    src = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1)
+    dst = np.empty(src.size, dtype=np.int16)
+    _f32_to_s16_kernel(src, dst)
+    return dst.tobytes()
 
 
 def get_subprocess_kwargs() -> Dict[str, Any]:
     """
-    Get platform-specific subprocess parameters
-    获取平台相关的 subprocess 参数
+    Get platform-specific subprocess parameters (a copy the caller may extend)
+    获取平台相关的 subprocess 参数（返回副本，调用方可追加）
     """
-    kwargs = {}
-    if sys.platform == "win32":
-        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-    return kwargs
+    return dict(SUBPROCESS_KWARGS)
 
 
 def terminate_process(process: Optional[subprocess.Popen], timeout: float = 2.0):
@@ -73,8 +159,8 @@ def terminate_process(process: Optional[subprocess.Popen], timeout: float = 2.0)
     try:
         process.terminate()
         process.wait(timeout=timeout)
-    except:
+    except (subprocess.SubprocessError, OSError):
         try:
             process.kill()
-        except:
+        except OSError:
             pass
@@ -6,10 +6,35 @@ Uses ffprobe (part of FFmpeg suite) to extract media metadata.
 import asyncio
 import subprocess
 import json
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
+from core.ffmpeg_utils import FFPROBE_EXE, SUBPROCESS_KWARGS
 from core.utils import log_debug, log_warning
 
+# orjson is optional, parses in C when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Probe result cache: url -> (probe time, media info), oldest first
+PROBE_CACHE_SIZE = 128
+PROBE_CACHE_TTL = 300.0  # seconds
+_probe_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse ffprobe JSON output bytes (invalid UTF-8 in tags is ignored)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects invalid UTF-8, fall back to a lenient decode
+            pass
+    return json.loads(data.decode('utf-8', errors='ignore'))
+
 
 async def probe_media(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
     """
@@ -32,10 +57,33 @@ async def probe_media(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any
             "album": "Album Name"
         }
         Returns None if probe fails.
+
+    Successful results are cached per URL for PROBE_CACHE_TTL seconds.
     """
+    now = time.monotonic()
+    cached = _probe_cache.get(url)
+    if cached is not None:
+        probed_at, info = cached
+        if now - probed_at < PROBE_CACHE_TTL:
+            _probe_cache.move_to_end(url)
+            return dict(info)
+        del _probe_cache[url]
+
+    info = await _probe_media(url, timeout)
+    if info is not None:
+        _probe_cache[url] = (now, info)
+        _probe_cache.move_to_end(url)
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+        return dict(info)
+    return None
+
+
+async def _probe_media(url: str, timeout: float) -> Optional[Dict[str, Any]]:
+    """Run ffprobe and build the media info dictionary (uncached)"""
     try:
         cmd = [
-            "ffprobe",
+            FFPROBE_EXE,
             "-v", "quiet",
             "-print_format", "json",
             "-show_format",
@@ -48,13 +96,12 @@ async def probe_media(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any
         loop = asyncio.get_running_loop()
 
         def run_ffprobe():
+            # Keep output as bytes, the JSON parser decodes it
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
-                encoding='utf-8',
-                errors='ignore'  # Ignore encoding errors
+                **SUBPROCESS_KWARGS
             )
             return result.stdout, result.stderr
 
@@ -64,7 +111,7 @@ async def probe_media(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any
             log_warning("FFprobe", f"No output from ffprobe")
             return None
 
-        data = json.loads(stdout)
+        data = _parse_json(stdout)
 
         # Extract audio stream info
         streams = data.get("streams", [])
@@ -101,16 +148,11 @@ async def probe_media(url: str, timeout: float = 10.0) -> Optional[Dict[str, Any
             result["duration"] = float(format_info["duration"])
 
         # Metadata tags: extract from format.tags (ID3, Vorbis, etc.)
-        tags = format_info.get("tags", {})
         # Tag keys may be uppercase or lowercase depending on format
-        for key in tags:
-            key_lower = key.lower()
-            if key_lower == "title":
-                result["title"] = tags[key]
-            elif key_lower == "artist":
-                result["artist"] = tags[key]
-            elif key_lower == "album":
-                result["album"] = tags[key]
+        tags = {key.lower(): value for key, value in format_info.get("tags", {}).items()}
+        result["title"] = tags.get("title", "")
+        result["artist"] = tags.get("artist", "")
+        result["album"] = tags.get("album", "")
         return result
 
     except subprocess.TimeoutExpired:
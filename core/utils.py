@@ -1,8 +1,12 @@
 """
 Logging utilities module
 """
-from datetime import datetime
+import atexit
+import queue
+import sys
 import threading
+import time
+from typing import Callable, List
 
 # Log levels
 LOG_LEVEL_DEBUG = 0
@@ -13,14 +17,92 @@ LOG_LEVEL_ERROR = 3
 # Current log level (configurable, will be set based on config.DEBUG)
 _current_log_level = LOG_LEVEL_INFO
 
-# Lock for atomic logging
+# Level names indexed by level
+_LEVEL_STR = ("DEBUG", "INFO", "WARN", "ERROR")
+
+# Formatted lines waiting for the writer thread
+_log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+# Set when lines are queued, wakes the writer thread
+_log_ready = threading.Event()
+
+# Held while lines are taken off the queue and written, so no flush can miss a batch in flight
 _log_lock = threading.Lock()
 
+# Callbacks notified when the log level changes
+_log_level_listeners: List[Callable[[int], None]] = []
+
 
 def set_log_level(level: int):
     """Set the log level"""
     global _current_log_level
     _current_log_level = level
+    for listener in _log_level_listeners:
+        listener(level)
+
+
+def get_log_level() -> int:
+    """Get the current log level"""
+    return _current_log_level
+
+
+def is_debug() -> bool:
+    """Whether DEBUG logs are emitted (guard expensive debug messages with it)"""
+    return _current_log_level <= LOG_LEVEL_DEBUG
+
+
+def add_log_level_listener(listener: Callable[[int], None]):
+    """Register a callback invoked with the new level whenever it changes"""
+    _log_level_listeners.append(listener)
+
+
+def _timestamp() -> str:
+    """Current local time as 'YYYY/MM/DD HH:MM:SS.mmm'"""
+    now = time.time()
+    return f"{time.strftime('%Y/%m/%d %H:%M:%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}"
+
+
+def _write_pending(last: str = ""):
+    """Write every queued line, then `last`, to stdout in one call"""
+    with _log_lock:
+        buf = []
+        while True:
+            try:
+                buf.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if last:
+            buf.append(last)
+        if not buf:
+            return
+        try:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _write_line(line: str, level: int):
+    """Queue an INFO/DEBUG line for the writer thread, write WARN/ERROR lines right away"""
+    if level >= LOG_LEVEL_WARNING:
+        # Synchronous, so warnings and errors are on stdout before a following print() or exit
+        _write_pending(line)
+    else:
+        _log_queue.put(line)
+        _log_ready.set()
+
+
+def _drain():
+    """Writer thread: wait for queued lines and flush them in one batch"""
+    while True:
+        _log_ready.wait()
+        _log_ready.clear()
+        _write_pending()
+
+
+threading.Thread(target=_drain, name="log-writer", daemon=True).start()
+# Lines still queued when the interpreter exits are written synchronously
+atexit.register(_write_pending)
 
 
 def log(tag: str, message: str, level: int = LOG_LEVEL_INFO):
@@ -35,37 +117,65 @@ def log(tag: str, message: str, level: int = LOG_LEVEL_INFO):
     if level < _current_log_level:
         return
 
-    now = datetime.now()
-    timestamp = now.strftime("%Y/%m/%d %H:%M:%S")
-    milliseconds = now.microsecond // 1000  # Convert microseconds to milliseconds
-    formatted_time = f"{timestamp}.{milliseconds:03d}"
-
-    level_str = {
-        LOG_LEVEL_DEBUG: "DEBUG",
-        LOG_LEVEL_INFO: "INFO",
-        LOG_LEVEL_WARNING: "WARN",
-        LOG_LEVEL_ERROR: "ERROR"
-    }.get(level, "INFO")
-
-    with _log_lock:
-        print(f"[{formatted_time}] [{level_str}] [{tag}] {message}", flush=True)
+    level_str = _LEVEL_STR[level] if 0 <= level < 4 else "INFO"
+    _write_line(f"[{_timestamp()}] [{level_str}] [{tag}] {message}\n", level)
 
 
 def log_debug(tag: str, message: str):
     """Output DEBUG level log"""
-    log(tag, message, LOG_LEVEL_DEBUG)
+    if _current_log_level <= LOG_LEVEL_DEBUG:
+        log(tag, message, LOG_LEVEL_DEBUG)
 
 
 def log_info(tag: str, message: str):
     """Output INFO level log"""
-    log(tag, message, LOG_LEVEL_INFO)
+    if _current_log_level <= LOG_LEVEL_INFO:
+        log(tag, message, LOG_LEVEL_INFO)
 
 
 def log_warning(tag: str, message: str):
     """Output WARNING level log"""
-    log(tag, message, LOG_LEVEL_WARNING)
+    if _current_log_level <= LOG_LEVEL_WARNING:
+        log(tag, message, LOG_LEVEL_WARNING)
 
 
 def log_error(tag: str, message: str):
     """Output ERROR level log"""
     log(tag, message, LOG_LEVEL_ERROR)
+
+
+class TaggedLogger:
+    """Logger bound to one tag, with the " [tag] " part of the line built once"""
+
+    __slots__ = ("tag", "_infix")
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self._infix = f" [{tag}] "
+
+    def _emit(self, message: str, level: int):
+        _write_line(f"[{_timestamp()}] [{_LEVEL_STR[level]}]{self._infix}{message}\n", level)
+
+    def debug(self, message: str):
+        """Output DEBUG level log"""
+        if _current_log_level <= LOG_LEVEL_DEBUG:
+            self._emit(message, LOG_LEVEL_DEBUG)
+
+    def info(self, message: str):
+        """Output INFO level log"""
+        if _current_log_level <= LOG_LEVEL_INFO:
+            self._emit(message, LOG_LEVEL_INFO)
+
+    def warning(self, message: str):
+        """Output WARNING level log"""
+        if _current_log_level <= LOG_LEVEL_WARNING:
+            self._emit(message, LOG_LEVEL_WARNING)
+
+    def error(self, message: str):
+        """Output ERROR level log"""
+        self._emit(message, LOG_LEVEL_ERROR)
+
+
+def make_logger(tag: str) -> TaggedLogger:
+    """Create a logger for a fixed tag (e.g. logger = make_logger("AirPlayScanner"))"""
+    return TaggedLogger(tag)
@@ -2,15 +2,66 @@
 AirPlayScanner - Discover AirPlay devices on the network
 """
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+import sys
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 
 import pyatv
 from pyatv.const import Protocol
 
-from core.utils import log_info, log_debug, log_warning
-from core.event_bus import event_bus
+# zeroconf ships with pyatv, used to wake the scan loop when devices announce themselves
+try:
+    from zeroconf import ServiceStateChange
+    from zeroconf.asyncio import AsyncServiceBrowser, AsyncZeroconf
+except ImportError:
+    AsyncZeroconf = None
+
+from core.utils import make_logger, is_debug
+from core.event_bus import discovery_bus
 from core.events import device_offline_threshold_reached
-from config import AIRPLAY_SCAN_TIMEOUT, AIRPLAY_SCAN_INTERVAL, AIRPLAY_EXCLUDE, AIRPLAY_OFFLINE_THRESHOLD
+from config import (AIRPLAY_SCAN_TIMEOUT, AIRPLAY_SCAN_INTERVAL, AIRPLAY_EXCLUDE, AIRPLAY_OFFLINE_THRESHOLD,
+                    AIRPLAY_LOST_AFTER_SCANS, AIRPLAY_BROAD_SCAN_EVERY, AIRPLAY_REFRESH_SCAN_TIMEOUT)
+
+logger = make_logger("AirPlayScanner")
+
+# mDNS service types browsed for new AirPlay devices
+AIRPLAY_SERVICE_TYPES = ["_airplay._tcp.local.", "_raop._tcp.local."]
+
+
+@dataclass(slots=True, frozen=True)
+class DiscoveredDevice:
+    """AirPlay device found by a scan"""
+    name: str
+    identifier: str
+    address: str
+    model: str
+    services: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        data = asdict(self)
+        data["services"] = list(self.services)
+        return data
+
+
+def _enum_name(value) -> str:
+    """Name of a pyatv enum member (e.g. DeviceModel.HomePod -> "HomePod")"""
+    try:
+        return value.name
+    except AttributeError:
+        return str(value).split(".")[-1]
+
+
+# Protocol tuple -> protocol names; only a handful of combinations ever occur
+_service_names_cache: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
+
+
+def _service_names(protocols: Tuple[Any, ...]) -> Tuple[str, ...]:
+    """Names of a device's service protocols, memoized per protocol combination"""
+    names = _service_names_cache.get(protocols)
+    if names is None:
+        names = _service_names_cache[protocols] = tuple(_enum_name(p) for p in protocols)
+    return names
 
 
 class AirPlayScanner:
@@ -19,12 +70,23 @@ class AirPlayScanner:
 
     Periodically scans the network for AirPlay devices and notifies
     when devices are discovered or lost.
+
+    A long-lived zeroconf browser wakes the scan loop as soon as a new
+    AirPlay service is announced, and its cache is shared with pyatv.scan
+    so each scan doesn't start a fresh mDNS stack.
     """
 
+    __slots__ = (
+        "_on_device_found", "_on_device_lost", "_on_offline_threshold", "_devices", "_offline_counters",
+        "_devices_list", "_last_fingerprint", "_running", "_scan_task", "_loop",
+        "_aiozc", "_browser", "_wakeup", "_seen_services",
+    )
+
     def __init__(
         self,
-        on_device_found: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_device_found: Optional[Callable[[DiscoveredDevice], None]] = None,
         on_device_lost: Optional[Callable[[str], None]] = None,
+        on_offline_threshold: Optional[Callable[[str], None]] = None,
     ):
         """
         Initialize AirPlay scanner.
@@ -32,32 +94,55 @@ class AirPlayScanner:
         Args:
             on_device_found: Callback when a new device is found
             on_device_lost: Callback when a device is lost
+            on_offline_threshold: Callback when a device reaches the offline threshold
         """
         self._on_device_found = on_device_found
         self._on_device_lost = on_device_lost
+        self._on_offline_threshold = on_offline_threshold
 
-        self._devices: Dict[str, Dict[str, Any]] = {}  # identifier -> device info
+        self._devices: Dict[str, DiscoveredDevice] = {}  # identifier -> device info
         self._offline_counters: Dict[str, int] = {}  # identifier -> offline count
+        self._devices_list: Optional[List[DiscoveredDevice]] = None  # get_devices() snapshot
+        self._last_fingerprint: Optional[frozenset] = None  # (identifier, address) pairs of the last applied scan
         self._running = False
         self._scan_task: Optional[asyncio.Task] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aiozc: Optional["AsyncZeroconf"] = None
+        self._browser: Optional["AsyncServiceBrowser"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._seen_services: Set[str] = set()  # mDNS service names already announced
 
-    async def scan_once(self) -> List[Dict[str, Any]]:
+    async def scan_once(self, refresh: bool = False) -> List[DiscoveredDevice]:
         """
         Perform a single scan for AirPlay devices.
 
+        Args:
+            refresh: Only re-check known devices at their last addresses
+                     (falls back to a broad scan when no device is known)
+
         Returns:
-            List of discovered device info dictionaries
+            List of discovered devices
         """
-        log_debug("AirPlayScanner", f"Starting device scan (timeout={AIRPLAY_SCAN_TIMEOUT}s)")
+        hosts = [info.address for info in self._devices.values()] if refresh else None
+        timeout = AIRPLAY_REFRESH_SCAN_TIMEOUT if hosts else AIRPLAY_SCAN_TIMEOUT
+        logger.debug(f"Starting {'refresh' if hosts else 'device'} scan (timeout={timeout}s)")
 
         try:
             # Scan for AirPlay devices
-            atvs = await pyatv.scan(
-                loop=self._loop or asyncio.get_event_loop(),
-                timeout=AIRPLAY_SCAN_TIMEOUT,
-                protocol=Protocol.AirPlay,
-            )
+            if hosts:
+                atvs = await pyatv.scan(
+                    loop=self._loop or asyncio.get_running_loop(),
+                    timeout=timeout,
+                    protocol=Protocol.AirPlay,
+                    hosts=hosts,
+                )
+            else:
+                atvs = await pyatv.scan(
+                    loop=self._loop or asyncio.get_running_loop(),
+                    timeout=timeout,
+                    protocol=Protocol.AirPlay,
+                    aiozc=self._aiozc,
+                )
 
             discovered = []
             for atv in atvs:
@@ -66,152 +151,250 @@ class AirPlayScanner:
                         or atv.name in AIRPLAY_EXCLUDE):
                     continue
 
-                # Extract device model (convert enum to string)
+                # Extract device model (enum name)
                 model = "Unknown"
                 if atv.device_info and atv.device_info.model:
-                    model = str(atv.device_info.model).split(".")[-1]
-
-                device_info = {
-                    "name": atv.name,
-                    "identifier": atv.identifier,
-                    "address": device_address,
-                    "model": model,
-                    "services": [
-                        str(service.protocol).split(".")[-1]
-                        for service in atv.services
-                    ],
-                }
+                    model = _enum_name(atv.device_info.model)
+
+                # Interned so the id keys in scanner and manager maps compare by identity
+                identifier = atv.identifier
+                if identifier:
+                    identifier = sys.intern(identifier)
+
+                device_info = DiscoveredDevice(
+                    name=atv.name,
+                    identifier=identifier,
+                    address=device_address,
+                    model=model,
+                    services=_service_names(tuple(service.protocol for service in atv.services)),
+                )
                 discovered.append(device_info)
 
-                log_debug(
-                    "AirPlayScanner",
-                    f"Found device: {device_info['name']} ({device_info['address']}) [{device_info['model']}]"
-                )
+                if is_debug():
+                    logger.debug(f"Found device: {device_info.name} ({device_info.address}) [{device_info.model}]")
 
-            log_debug("AirPlayScanner", f"Scan complete, found {len(discovered)} device(s)")
+            logger.debug(f"Scan complete, found {len(discovered)} device(s)")
             return discovered
 
         except Exception as e:
-            log_warning("AirPlayScanner", f"Scan failed: {e}")
+            logger.warning(f"Scan failed: {e}")
             return []
 
     async def _scan_loop(self):
         """
         Continuous scanning loop.
         """
-        log_info("AirPlayScanner", "Starting periodic device scanning")
+        logger.info("Starting periodic device scanning")
 
+        cycle = 0
+        announced = False
         while self._running:
             try:
-                # Perform scan
-                discovered = await self.scan_once()
-
-                # Build set of discovered identifiers
-                discovered_ids = {d["identifier"] for d in discovered}
-                current_ids = set(self._devices.keys())
-
-                # Check for new devices
-                for device_info in discovered:
-                    identifier = device_info["identifier"]
-                    if identifier not in self._devices:
-                        # New device found
-                        self._devices[identifier] = device_info
-                        self._offline_counters[identifier] = 0  # Reset counter
-                        log_info(
-                            "AirPlayScanner",
-                            f"New device discovered: {device_info['name']} ({device_info['address']})"
-                        )
-                        if self._on_device_found:
-                            try:
-                                self._on_device_found(device_info)
-                            except Exception as e:
-                                log_warning("AirPlayScanner", f"on_device_found callback error: {e}")
-                    else:
-                        # Device already known
-                        was_offline = self._offline_counters.get(identifier, 0) > 0
-
-                        # Update existing device info (address may change)
-                        self._devices[identifier] = device_info
-                        # Device still online, reset offline counter
-                        self._offline_counters[identifier] = 0
-
-                        # If device was offline and now back online, trigger found callback
-                        if was_offline:
-                            log_info(
-                                "AirPlayScanner",
-                                f"Device reconnected: {device_info['name']} ({device_info['address']})"
-                            )
-                            if self._on_device_found:
-                                try:
-                                    self._on_device_found(device_info)
-                                except Exception as e:
-                                    log_warning("AirPlayScanner", f"on_device_found callback error: {e}")
-
-                # Check for lost devices
-                lost_ids = current_ids - discovered_ids
-                for identifier in lost_ids:
-                    device_info = self._devices.get(identifier)
-                    if not device_info:
-                        continue
-
-                    # Increment offline counter
-                    self._offline_counters[identifier] = self._offline_counters.get(identifier, 0) + 1
-                    offline_count = self._offline_counters[identifier]
-
-                    if offline_count == 1:
-                        # First time offline: trigger existing callback (backward compatibility)
-                        log_info(
-                            "AirPlayScanner",
-                            f"Device lost: {device_info['name']} ({device_info['address']})"
-                        )
-                        if self._on_device_lost:
-                            try:
-                                self._on_device_lost(identifier)
-                            except Exception as e:
-                                log_warning("AirPlayScanner", f"on_device_lost callback error: {e}")
-
-                    elif offline_count >= AIRPLAY_OFFLINE_THRESHOLD:
-                        # Threshold reached: publish event and remove from scanner
-                        log_info(
-                            "AirPlayScanner",
-                            f"Device {device_info['name']} offline for {offline_count} scans, "
-                            f"threshold reached ({AIRPLAY_OFFLINE_THRESHOLD})"
-                        )
-
-                        # Publish event to trigger device removal
-                        event_bus.publish(device_offline_threshold_reached(identifier))
-
-                        # Remove from scanner's tracking
-                        self._devices.pop(identifier, None)
-                        self._offline_counters.pop(identifier, None)
-
-                # Wait for next scan interval
-                await asyncio.sleep(AIRPLAY_SCAN_INTERVAL)
+                # Perform scan: broad every AIRPLAY_BROAD_SCAN_EVERY cycles or on a new announcement,
+                # otherwise a quick refresh of the known devices
+                refresh = not announced and cycle % AIRPLAY_BROAD_SCAN_EVERY != 0
+                cycle += 1
+                discovered = await self.scan_once(refresh=refresh)
+                if not refresh and self._wakeup is not None:
+                    # Announcements that arrived during a broad scan are covered by it
+                    self._wakeup.clear()
+
+                # Index discovered devices by identifier
+                discovered_map = {d.identifier: d for d in discovered}
+
+                if refresh and not self._devices.keys() <= discovered_map.keys():
+                    # A known device didn't answer at its address (it may have moved),
+                    # confirm with a broad scan before counting it as lost
+                    discovered = await self.scan_once()
+                    discovered_map = {d.identifier: d for d in discovered}
+
+                # Identical (identifier, address) pairs as last time with nothing offline: nothing to do
+                fingerprint = frozenset((d.identifier, d.address) for d in discovered_map.values())
+                if fingerprint != self._last_fingerprint or len(discovered_map) != len(self._devices):
+                    self._apply_scan(discovered_map)
+                    self._last_fingerprint = fingerprint
+
+                # Wait for next scan interval (or a new device announcement)
+                announced = await self._wait_next_scan()
 
             except asyncio.CancelledError:
-                log_debug("AirPlayScanner", "Scan loop cancelled")
+                logger.debug("Scan loop cancelled")
                 break
             except Exception as e:
-                log_warning("AirPlayScanner", f"Scan loop error: {e}")
+                logger.warning(f"Scan loop error: {e}")
                 await asyncio.sleep(AIRPLAY_SCAN_INTERVAL)
 
-        log_info("AirPlayScanner", "Periodic scanning stopped")
+        logger.info("Periodic scanning stopped")
+
+    def _apply_scan(self, discovered_map: Dict[str, DiscoveredDevice]):
+        """
+        Diff a scan result against known devices and fire callbacks.
+
+        Args:
+            discovered_map: identifier -> device info of the devices found by the scan
+        """
+        # Device info is replaced below, drop the get_devices() snapshot
+        self._devices_list = None
+
+        # Diff against known devices once, then handle each subset
+        known_ids = self._devices.keys()
+        new_ids = discovered_map.keys() - known_ids
+        seen_ids = discovered_map.keys() & known_ids
+        lost_ids = known_ids - discovered_map.keys()
+
+        # New devices
+        for identifier in new_ids:
+            device_info = discovered_map[identifier]
+            self._devices[identifier] = device_info
+            self._offline_counters[identifier] = 0  # Reset counter
+            logger.info(f"New device discovered: {device_info.name} ({device_info.address})")
+            if self._on_device_found:
+                try:
+                    self._on_device_found(device_info)
+                except Exception as e:
+                    logger.warning(f"on_device_found callback error: {e}")
+
+        # Devices already known
+        for identifier in seen_ids:
+            device_info = discovered_map[identifier]
+            missed = self._offline_counters.get(identifier, 0)
+            moved = self._devices[identifier].address != device_info.address
+
+            # Update existing device info (address may change)
+            self._devices[identifier] = device_info
+            # Device still online, reset offline counter
+            self._offline_counters[identifier] = 0
+
+            # Back after a reported loss (or at a new address after missed scans): trigger found callback.
+            # Back at the same address before the loss was reported: a flap, nothing to do
+            if missed >= AIRPLAY_LOST_AFTER_SCANS or (missed and moved):
+                logger.info(f"Device reconnected: {device_info.name} ({device_info.address})")
+                if self._on_device_found:
+                    try:
+                        self._on_device_found(device_info)
+                    except Exception as e:
+                        logger.warning(f"on_device_found callback error: {e}")
+
+        # Check for lost devices
+        for identifier in lost_ids:
+            device_info = self._devices.get(identifier)
+            if not device_info:
+                continue
+
+            # Increment offline counter
+            self._offline_counters[identifier] = self._offline_counters.get(identifier, 0) + 1
+            offline_count = self._offline_counters[identifier]
+
+            if offline_count == AIRPLAY_LOST_AFTER_SCANS:
+                # Missed enough consecutive scans to rule out a flap: report the loss
+                logger.info(f"Device lost: {device_info.name} ({device_info.address})")
+                if self._on_device_lost:
+                    try:
+                        self._on_device_lost(identifier)
+                    except Exception as e:
+                        logger.warning(f"on_device_lost callback error: {e}")
+
+            if offline_count >= AIRPLAY_OFFLINE_THRESHOLD:
+                # Threshold reached: notify, publish event and remove from scanner
+                logger.info(
+                    f"Device {device_info.name} offline for {offline_count} scans, "
+                    f"threshold reached ({AIRPLAY_OFFLINE_THRESHOLD})"
+                )
+
+                # Owner removes the device directly, the event is left for any other listeners
+                if self._on_offline_threshold:
+                    try:
+                        self._on_offline_threshold(identifier)
+                    except Exception as e:
+                        logger.warning(f"on_offline_threshold callback error: {e}")
+                discovery_bus.publish(device_offline_threshold_reached(identifier))
+
+                # Remove from scanner's tracking
+                self._devices.pop(identifier, None)
+                self._offline_counters.pop(identifier, None)
+
+    async def _wait_next_scan(self) -> bool:
+        """
+        Sleep until the next scan interval, returning early when a new service is announced.
+
+        Returns:
+            True if woken by an announcement
+        """
+        if self._wakeup is None:
+            await asyncio.sleep(AIRPLAY_SCAN_INTERVAL)
+            return False
+        announced = False
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=AIRPLAY_SCAN_INTERVAL)
+            logger.debug("New AirPlay service announced, scanning now")
+            announced = True
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+        return announced
+
+    def _on_service_state_change(self, zeroconf, service_type: str, name: str, state_change) -> None:
+        """zeroconf browser handler: pass added / removed services to the loop."""
+        if state_change is ServiceStateChange.Added:
+            self._loop.call_soon_threadsafe(self._on_service_announced, name, True)
+        elif state_change is ServiceStateChange.Removed:
+            self._loop.call_soon_threadsafe(self._on_service_announced, name, False)
+
+    def _on_service_announced(self, name: str, added: bool):
+        """Wake the scan loop for a service not seen before (re-announcements of known ones don't)."""
+        if not added:
+            self._seen_services.discard(name)
+            return
+        if name in self._seen_services:
+            return
+        self._seen_services.add(name)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _start_browser(self):
+        """Start the long-lived zeroconf browser (falls back to plain polling if unavailable)."""
+        if AsyncZeroconf is None:
+            return
+        try:
+            self._aiozc = AsyncZeroconf()
+            self._wakeup = asyncio.Event()
+            self._browser = AsyncServiceBrowser(
+                self._aiozc.zeroconf,
+                AIRPLAY_SERVICE_TYPES,
+                handlers=[self._on_service_state_change],
+            )
+        except Exception as e:
+            logger.warning(f"zeroconf browser unavailable, using periodic scans only: {e}")
+            self._aiozc = None
+            self._browser = None
+            self._wakeup = None
+
+    async def _close_browser(self, browser: Optional["AsyncServiceBrowser"], aiozc: Optional["AsyncZeroconf"]):
+        """Close the zeroconf browser and instance."""
+        try:
+            if browser:
+                await browser.async_cancel()
+            if aiozc:
+                await aiozc.async_close()
+        except Exception as e:
+            logger.debug(f"zeroconf close error: {e}")
 
     def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """
-        Start periodic scanning.
+        Start periodic scanning (must be called from the running event loop).
 
         Args:
-            loop: Event loop to use (optional)
+            loop: Event loop to use (optional, defaults to the running loop)
         """
         if self._running:
-            log_debug("AirPlayScanner", "Scanner already running")
+            logger.debug("Scanner already running")
             return
 
         self._running = True
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop = loop or asyncio.get_running_loop()
+        self._start_browser()
         self._scan_task = asyncio.create_task(self._scan_loop())
-        log_info("AirPlayScanner", "Scanner started")
+        logger.info("Scanner started")
 
     def stop(self):
         """
@@ -221,22 +404,35 @@ class AirPlayScanner:
             return
 
         self._running = False
+        loop_open = self._loop is not None and not self._loop.is_closed()
         if self._scan_task:
-            self._scan_task.cancel()
+            if loop_open:
+                self._loop.call_soon_threadsafe(self._scan_task.cancel)
             self._scan_task = None
 
-        log_info("AirPlayScanner", "Scanner stopped")
+        if self._aiozc and loop_open:
+            self._loop.call_soon_threadsafe(
+                asyncio.ensure_future, self._close_browser(self._browser, self._aiozc)
+            )
+        self._browser = None
+        self._aiozc = None
+        self._wakeup = None
+        self._seen_services.clear()
+
+        logger.info("Scanner stopped")
 
-    def get_devices(self) -> List[Dict[str, Any]]:
+    def get_devices(self) -> List[DiscoveredDevice]:
         """
         Get list of currently discovered devices.
 
         Returns:
-            List of device info dictionaries
+            List of discovered devices (shared snapshot, do not modify)
         """
-        return list(self._devices.values())
+        if self._devices_list is None:
+            self._devices_list = list(self._devices.values())
+        return self._devices_list
 
-    def get_device(self, identifier: str) -> Optional[Dict[str, Any]]:
+    def get_device(self, identifier: str) -> Optional[DiscoveredDevice]:
         """
         Get device info by identifier.
 
@@ -244,7 +440,7 @@ class AirPlayScanner:
             identifier: Device identifier
 
         Returns:
-            Device info dictionary or None
+            Discovered device or None
         """
         return self._devices.get(identifier)
 
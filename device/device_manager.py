@@ -8,16 +8,24 @@ This module manages the lifecycle of virtual devices:
 - Loads/saves device configuration via ConfigStore
 """
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Mapping, Optional, Any, Callable, Set, TYPE_CHECKING
 
-from core.utils import log_info, log_debug, log_warning, log_error
-from core.event_bus import event_bus
-from core.events import EventType, device_added, device_removed, device_connected, device_disconnected, cmd_stop
+from core.utils import make_logger, is_debug
+from core.event_bus import event_bus, set_bus_loop
+from core.events import Event, device_added, device_removed, device_connected, device_disconnected, cmd_stop
 from core.config_store import config_store
 from config import ENABLE_SERVER_SPEAKER
 from output.audio_device_detector import has_audio_output_device, log_audio_devices
+from output.protocols import ReconnectableOutput
 from .virtual_device import VirtualDevice
-from .airplay_scanner import AirPlayScanner
+from .airplay_scanner import AirPlayScanner, DiscoveredDevice
+
+if TYPE_CHECKING:
+    from enhancer.base import BaseEnhancer
+
+logger = make_logger("DeviceManager")
 
 
 class DeviceManager:
@@ -31,72 +39,191 @@ class DeviceManager:
     - Loading/saving device configuration
     """
 
+    # Nothing attaches attributes to the manager from outside
+    __slots__ = (
+        "_devices", "_airplay_map", "_uuid_index", "_server_speaker_id",
+        "_saved_configs", "_all_list", "_airplay_list", "_scanner", "_running", "_loop",
+        "_event_outbox", "_bulk_mode", "_op_queue", "_op_task", "_output_factory",
+        "_enhancer_factory", "_attach_tasks",
+    )
+
     def __init__(self):
         """Initialize device manager."""
         self._devices: Dict[str, VirtualDevice] = {}  # device_id -> VirtualDevice
         self._airplay_map: Dict[str, str] = {}  # airplay_id -> device_id
+        self._uuid_index: Dict[str, str] = {}  # dlna_uuid -> device_id
+        self._server_speaker_id: Optional[str] = None
+
+        # Live read-only view of the saved device configs, set in start()
+        self._saved_configs: Mapping[str, Dict[str, Any]] = {}
+
+        # Device list snapshots, rebuilt after a device is added or removed
+        self._all_list: Optional[List[VirtualDevice]] = None
+        self._airplay_list: Optional[List[VirtualDevice]] = None
+
         self._scanner = AirPlayScanner(
             on_device_found=self._on_airplay_found,
             on_device_lost=self._on_airplay_lost,
+            on_offline_threshold=self._on_device_offline_threshold_reached,
         )
         self._running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Device events queued for publishing in one loop callback;
+        # held back entirely while start() creates the initial devices
+        self._event_outbox: Deque[Event] = deque()
+        self._bulk_mode = False
+
+        # Device start/shutdown batches, run in order by one consumer task on the loop
+        self._op_queue: Optional[asyncio.Queue] = None
+        self._op_task: Optional[asyncio.Task] = None
+
+        # Pending output attachments (enhancer being built in the executor)
+        self._attach_tasks: Set[asyncio.Task] = set()
+
         # Callbacks for output creation (set by run.py)
         self._output_factory: Optional[Callable[[VirtualDevice], None]] = None
+        self._enhancer_factory: Optional[Callable[[], "BaseEnhancer"]] = None
 
-        # Subscribe to device offline threshold reached event
-        event_bus.subscribe(
-            EventType.DEVICE_OFFLINE_THRESHOLD_REACHED,
-            self._on_device_offline_threshold_reached
-        )
-
-    def set_output_factory(self, factory: Callable[[VirtualDevice], None]):
+    def set_output_factory(self, factory: Callable[[VirtualDevice], None],
+                           enhancer_factory: Optional[Callable[[], "BaseEnhancer"]] = None):
         """
-        Set factory function for creating outputs.
+        Set factory functions for creating outputs.
 
         Args:
-            factory: Function that creates and attaches output to device
+            factory: Function that creates and attaches output to device (called on the manager loop)
+            enhancer_factory: Function that builds a DSP enhancer, called in the default executor
+                and set on the device before the output factory runs
         """
         self._output_factory = factory
+        self._enhancer_factory = enhancer_factory
+
+    def _schedule(self, coro):
+        """
+        Run a coroutine on the manager's loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+        """
+        self._loop.call_soon_threadsafe(asyncio.ensure_future, coro)
+
+    def _enqueue(self, op: str, devices: List[VirtualDevice]):
+        """
+        Queue a device start/shutdown batch for the op consumer.
+
+        Args:
+            op: "start" or "shutdown"
+            devices: Devices to run the operation on
+        """
+        item = (op, devices)
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._op_queue.put_nowait(item)
+        else:
+            self._loop.call_soon_threadsafe(self._op_queue.put_nowait, item)
+
+    async def _op_consumer(self):
+        """Run queued device start/shutdown batches."""
+        while True:
+            op, devices = await self._op_queue.get()
+            try:
+                if op == "start":
+                    await self._start_all(devices)
+                else:
+                    await self._shutdown_all(devices)
+            except Exception as e:
+                logger.warning(f"Device {op} failed: {e}")
 
-    def _on_airplay_found(self, airplay_info: Dict[str, Any]):
+    def _on_airplay_found(self, airplay_info: DiscoveredDevice):
         """
         Handle AirPlay device discovery.
 
         Args:
             airplay_info: AirPlay device information
         """
-        airplay_id = airplay_info.get("identifier")
+        airplay_id = airplay_info.identifier
         if not airplay_id:
             return
 
         # Check if we already have a virtual device for this AirPlay device
-        if airplay_id in self._airplay_map:
+        device_id = self._airplay_map.get(airplay_id)
+        if device_id:
             # Update existing device info
-            device_id = self._airplay_map[airplay_id]
             device = self._devices.get(device_id)
+            address = airplay_info.address
             if device:
-                device.airplay_address = airplay_info.get("address")
+                device_name = device.device_name
+                was_connected = device.connected
+                device.airplay_address = address
                 device.connected = True
-                log_debug("DeviceManager", f"Updated AirPlay device: {device.device_name}")
+                logger.debug(f"Updated AirPlay device: {device_name}")
 
                 # Re-establish pyatv connection for reconnected device
                 output = device.get_output()
-                if output and hasattr(output, 'run_coroutine'):
+                output_loop = output.loop if device.output_caps.reconnect else None
+                if output_loop:
                     try:
-                        if hasattr(output, 'loop') and output.loop:
-                            log_info("DeviceManager", f"Re-establishing connection: {device.device_name}")
-                            # Use output's own event loop to avoid "different loop" error
-                            output.run_coroutine(self._reconnect_output(output, device.device_name))
+                        logger.info(f"Re-establishing connection: {device_name}")
+                        # Fire and forget on the output's own event loop (its pyatv connection
+                        # lives there) to avoid "different loop" error
+                        output_loop.call_soon_threadsafe(
+                            asyncio.ensure_future,
+                            self._reconnect_output(output, device_name),
+                        )
                     except Exception as e:
-                        log_warning("DeviceManager", f"Reconnection scheduling failed: {e}")
+                        logger.warning(f"Reconnection scheduling failed: {e}")
+                        if is_debug():
+                            logger.debug(traceback.format_exc())
 
-                # Publish connected event
-                event_bus.publish(device_connected(device_id))
+                # Publish connected event (only on a disconnected -> connected transition)
+                if not was_connected:
+                    self._emit(device_connected(device_id))
             return
 
-        # Create new virtual device
+        # Create new virtual device, started once its output is attached
+        self._create_airplay_device(airplay_info)
+
+    async def _bulk_add_devices(self, infos: List[DiscoveredDevice]):
+        """
+        Handle a batch of discovered AirPlay devices (e.g. the initial scan).
+
+        Waits for the outputs of the new devices, then starts them together
+        in one batch.
+
+        Args:
+            infos: AirPlay device information list
+        """
+        new_devices = []
+        for airplay_info in infos:
+            if not airplay_info.identifier:
+                continue
+            if airplay_info.identifier in self._airplay_map:
+                self._on_airplay_found(airplay_info)
+            else:
+                new_devices.append(self._create_airplay_device(airplay_info, start=False))
+
+        if self._attach_tasks:
+            await asyncio.gather(*self._attach_tasks, return_exceptions=True)
+
+        # Skip devices removed (or a manager stopped) while their output was being built
+        new_devices = [d for d in new_devices if self._running and self._devices.get(d.device_id) is d]
+        if new_devices:
+            self._enqueue("start", new_devices)
+
+    def _create_airplay_device(self, airplay_info: DiscoveredDevice, start: bool = True) -> VirtualDevice:
+        """
+        Create and register a virtual device for a new AirPlay device.
+
+        Args:
+            airplay_info: AirPlay device information
+            start: Start the device once its output is attached (False when the caller starts a batch)
+
+        Returns:
+            The new virtual device
+        """
         device = VirtualDevice.create_airplay_device(airplay_info)
         device.connected = True
 
@@ -104,51 +231,57 @@ class DeviceManager:
         self._load_device_config(device)
 
         self._devices[device.device_id] = device
-        self._airplay_map[airplay_id] = device.device_id
+        self._airplay_map[airplay_info.identifier] = device.device_id
+        self._uuid_index[device.dlna_uuid] = device.device_id
+        self._invalidate_lists()
 
-        log_info("DeviceManager", f"Created virtual device: {device.device_name} (AirPlay: {airplay_info.get('name')}, id: {device.device_id})")
+        logger.info(f"Created virtual device: {device.device_name} (AirPlay: {airplay_info.name}, id: {device.device_id})")
 
-        # Start device (subscribe to events)
-        asyncio.run_coroutine_threadsafe(device.start(), self._loop)
+        # Create output via factory, then start the device and publish device added event
+        self._attach_output(device, start)
+        return device
 
-        # Create output via factory
-        if self._output_factory:
-            try:
-                self._output_factory(device)
-            except Exception as e:
-                log_warning("DeviceManager", f"Output factory error: {e}")
+    def _emit(self, event: Event):
+        """
+        Queue a device event, published with the rest of the queue from one loop callback.
 
-        # Publish device added event
-        event_bus.publish(device_added(device.device_id, device.to_dict()))
+        Args:
+            event: Event to publish
+        """
+        self._event_outbox.append(event)
+        if len(self._event_outbox) == 1 and not self._bulk_mode:
+            self._loop.call_soon_threadsafe(self._flush_events)
 
-    async def _reconnect_output(self, output, device_name: str):
+    def _flush_events(self):
+        """Publish all queued device events in order."""
+        outbox = self._event_outbox
+        events = [outbox.popleft() for _ in range(len(outbox))]
+        event_bus.publish_many(events)
+
+    async def _reconnect_output(self, output: ReconnectableOutput, device_name: str):
         """
         Reconnect output after device reconnection.
 
         Args:
-            output: AirPlayOutput instance
+            output: Output to reconnect (runs on its own loop)
             device_name: Device name for logging
         """
         try:
-            # Disconnect stale connection
-            if hasattr(output, 'disconnect'):
-                await output.disconnect()
-                log_debug("DeviceManager", f"Disconnected stale connection: {device_name}")
-
-            # Brief delay for cleanup
-            await asyncio.sleep(0.2)
+            # Disconnect stale connection (returns once the old connection has closed)
+            await output.disconnect()
+            logger.debug(f"Disconnected stale connection: {device_name}")
 
             # Establish new connection
-            if hasattr(output, 'connect'):
-                success = await output.connect()
-                if success:
-                    log_info("DeviceManager", f"Reconnection successful: {device_name}")
-                else:
-                    log_warning("DeviceManager", f"Reconnection failed: {device_name}")
+            success = await output.connect()
+            if success:
+                logger.info(f"Reconnection successful: {device_name}")
+            else:
+                logger.warning(f"Reconnection failed: {device_name}")
         except Exception as e:
-            log_error("DeviceManager", f"Reconnection error: {e}")
-            import traceback
-            log_debug("DeviceManager", traceback.format_exc())
+            logger.error(f"Reconnection error: {e}")
+            # Only walk the stack when the traceback will actually be printed
+            if is_debug():
+                logger.debug(traceback.format_exc())
 
     def _on_airplay_lost(self, airplay_id: str):
         """
@@ -163,35 +296,34 @@ class DeviceManager:
 
         device = self._devices.get(device_id)
         if device:
+            was_connected = device.connected
             device.connected = False
-            log_info("DeviceManager", f"AirPlay device disconnected: {device.device_name}")
+            logger.info(f"AirPlay device disconnected: {device.device_name}")
 
-            # Publish disconnected event
-            event_bus.publish(device_disconnected(device_id))
+            # Publish disconnected event (only on a connected -> disconnected transition)
+            if was_connected:
+                self._emit(device_disconnected(device_id))
 
-    def _on_device_offline_threshold_reached(self, event):
+    def _on_device_offline_threshold_reached(self, airplay_id: str):
         """
-        Handle device offline threshold reached event: remove virtual device.
+        Handle a device reaching the scanner's offline threshold: remove virtual device.
 
         Args:
-            event: Event containing airplay_id
+            airplay_id: AirPlay device identifier
         """
-        airplay_id = event.data.get("airplay_id")
-        if not airplay_id:
-            return
 
         device_id = self._airplay_map.get(airplay_id)
         if not device_id:
-            log_debug("DeviceManager", f"Device {airplay_id} not found in map, already removed")
+            logger.debug(f"Device {airplay_id} not found in map, already removed")
             return
 
         device = self._devices.get(device_id)
         if not device:
-            log_debug("DeviceManager", f"Device {device_id} not found, already removed")
+            logger.debug(f"Device {device_id} not found, already removed")
             return
 
-        log_info("DeviceManager",
-                f"Removing device {device.device_name} (ID: {device_id}) due to prolonged offline")
+        device_name = device.device_name
+        logger.info(f"Removing device {device_name} (ID: {device_id}) due to prolonged offline")
 
         # Stop device if playing
         if device.play_state != "STOPPED":
@@ -199,16 +331,70 @@ class DeviceManager:
 
         # Shutdown device (unsubscribe from events)
         if self._loop:
-            asyncio.run_coroutine_threadsafe(device.shutdown(), self._loop)
+            self._enqueue("shutdown", [device])
 
         # Remove from mappings
         del self._airplay_map[airplay_id]
         del self._devices[device_id]
+        self._invalidate_lists()
+        self._uuid_index.pop(device.dlna_uuid, None)
 
         # Publish device removed event
-        event_bus.publish(device_removed(device_id))
+        self._emit(device_removed(device_id))
+
+        logger.info(f"Device {device_name} removed successfully")
+
+    def _attach_output(self, device: VirtualDevice, start: bool = True):
+        """
+        Create the device's output, then start the device and publish DEVICE_ADDED.
+
+        With an enhancer factory set, the DSP enhancer (the slow part) is built
+        in the default executor and the rest follows in a task on the manager
+        loop (tracked in _attach_tasks). Either way the device only subscribes
+        to commands and is only announced once it has its output.
+
+        Args:
+            device: Virtual device that needs an output
+            start: Queue device.start() after attaching (False when the caller starts a batch)
+        """
+        if self._enhancer_factory:
+            task = self._loop.create_task(self._attach_output_async(device, start))
+            self._attach_tasks.add(task)
+            task.add_done_callback(self._attach_tasks.discard)
+            return
+        self._finish_attach(device, start)
+
+    async def _attach_output_async(self, device: VirtualDevice, start: bool):
+        """Build the enhancer in the executor, then attach the output on the loop."""
+        try:
+            enhancer = await self._loop.run_in_executor(None, self._enhancer_factory)
+            device.set_enhancer(enhancer)
+        except Exception as e:
+            logger.warning(f"Enhancer factory error: {e}")
+
+        # Manager stopped or device removed while the enhancer was being built
+        if not self._running or self._devices.get(device.device_id) is not device:
+            return
+
+        self._finish_attach(device, start)
 
-        log_info("DeviceManager", f"Device {device.device_name} removed successfully")
+    def _finish_attach(self, device: VirtualDevice, start: bool):
+        """Run the output factory, then start and announce the device."""
+        self._run_output_factory(device)
+        if start:
+            self._enqueue("start", [device])
+        self._emit(device_added(device.device_id, device.to_dict()))
+
+    def _run_output_factory(self, device: VirtualDevice):
+        """Call the output factory, logging failures."""
+        if not self._output_factory:
+            return
+        try:
+            self._output_factory(device)
+        except Exception as e:
+            logger.warning(f"Output factory error: {e}")
+            if is_debug():
+                logger.debug(traceback.format_exc())
 
     def _create_server_speaker(self):
         """Create Server Speaker virtual device for local audio output."""
@@ -219,21 +405,14 @@ class DeviceManager:
         self._load_device_config(device)
 
         self._devices[device.device_id] = device
+        self._uuid_index[device.dlna_uuid] = device.device_id
+        self._server_speaker_id = device.device_id
+        self._invalidate_lists()
 
-        log_info("DeviceManager", f"Created virtual device: {device.device_name} (id: {device.device_id})")
-
-        # Start device (subscribe to events)
-        asyncio.run_coroutine_threadsafe(device.start(), self._loop)
-
-        # Create output via factory
-        if self._output_factory:
-            try:
-                self._output_factory(device)
-            except Exception as e:
-                log_warning("DeviceManager", f"Output factory error: {e}")
+        logger.info(f"Created virtual device: {device.device_name} (id: {device.device_id})")
 
-        # Publish device added event
-        event_bus.publish(device_added(device.device_id, device.to_dict()))
+        # Create output via factory, then start the device and publish device added event
+        self._attach_output(device)
 
     async  def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """
@@ -246,36 +425,45 @@ class DeviceManager:
             return
 
         self._running = True
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop = loop or asyncio.get_running_loop()
 
         # Set event bus loop
-        event_bus.set_loop(self._loop)
+        set_bus_loop(self._loop)
+
+        logger.info("Starting device manager")
 
-        log_info("DeviceManager", "Starting device manager")
+        self._op_queue = asyncio.Queue()
+        self._op_task = self._loop.create_task(self._op_consumer())
+
+        # Read the config file in the executor, device configs are then served from memory
+        self._saved_configs = await self._loop.run_in_executor(None, config_store.get_all_device_configs)
 
         # Create Server Speaker device if enabled
         if ENABLE_SERVER_SPEAKER:
-            log_info("DeviceManager", "Server Speaker enabled in config")
+            logger.info("Server Speaker enabled in config")
             log_audio_devices()
 
             if has_audio_output_device():
                 self._create_server_speaker()
             else:
-                log_warning("DeviceManager",
-                           "Server Speaker enabled but no audio output device found - skipping creation")
+                logger.warning("Server Speaker enabled but no audio output device found - skipping creation")
         else:
-            log_info("DeviceManager", "Server Speaker disabled in config")
+            logger.info("Server Speaker disabled in config")
 
         # Start AirPlay scanner
         self._scanner.start(self._loop)
 
         # Perform initial scan
-        log_info("DeviceManager", "Performing initial AirPlay device scan...")
-        devices = await self._scanner.scan_once()
-        for device_info in devices:
-            self._on_airplay_found(device_info)
+        logger.info("Performing initial AirPlay device scan...")
+        self._bulk_mode = True
+        try:
+            await self._bulk_add_devices(await self._scanner.scan_once())
+        finally:
+            # Announce the initial devices together
+            self._bulk_mode = False
+            self._flush_events()
 
-        log_info("DeviceManager", f"Device manager started with {len(self._devices)} device(s)")
+        logger.info(f"Device manager started with {len(self._devices)} device(s)")
 
     def stop(self):
         """Stop device manager."""
@@ -285,11 +473,31 @@ class DeviceManager:
         self._running = False
         self._scanner.stop()
 
-        # Shutdown all devices
-        for device in self._devices.values():
-            asyncio.run_coroutine_threadsafe(device.shutdown(), self._loop)
+        # Queued starts are moot now; shut down every device directly
+        if self._op_task:
+            self._loop.call_soon_threadsafe(self._op_task.cancel)
+            self._op_task = None
+
+        # Shutdown all devices (one loop wakeup for the whole batch)
+        self._schedule(self._shutdown_all(list(self._devices.values())))
 
-        log_info("DeviceManager", "Device manager stopped")
+        logger.info("Device manager stopped")
+
+    @staticmethod
+    async def _start_all(devices: List[VirtualDevice]):
+        """Start devices concurrently."""
+        results = await asyncio.gather(*(device.start() for device in devices), return_exceptions=True)
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Start error for {device.device_name}: {result}")
+
+    @staticmethod
+    async def _shutdown_all(devices: List[VirtualDevice]):
+        """Shut down devices concurrently."""
+        results = await asyncio.gather(*(device.shutdown() for device in devices), return_exceptions=True)
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Shutdown error for {device.device_name}: {result}")
 
     def get_device(self, device_id: str) -> Optional[VirtualDevice]:
         """Get virtual device by ID."""
@@ -297,9 +505,9 @@ class DeviceManager:
 
     def get_device_by_uuid(self, dlna_uuid: str) -> Optional[VirtualDevice]:
         """Get virtual device by DLNA UUID."""
-        for device in self._devices.values():
-            if device.dlna_uuid == dlna_uuid:
-                return device
+        device_id = self._uuid_index.get(dlna_uuid)
+        if device_id:
+            return self._devices.get(device_id)
         return None
 
     def get_device_by_airplay_id(self, airplay_id: str) -> Optional[VirtualDevice]:
@@ -309,19 +517,28 @@ class DeviceManager:
             return self._devices.get(device_id)
         return None
 
+    def _invalidate_lists(self):
+        """Drop the device list snapshots after the device set changed."""
+        self._all_list = None
+        self._airplay_list = None
+
     def get_all_devices(self) -> List[VirtualDevice]:
-        """Get all virtual devices."""
-        return list(self._devices.values())
+        """Get all virtual devices (shared snapshot, do not modify)."""
+        if self._all_list is None:
+            self._all_list = list(self._devices.values())
+        return self._all_list
 
     def get_airplay_devices(self) -> List[VirtualDevice]:
-        """Get all AirPlay virtual devices."""
-        return [d for d in self._devices.values() if d.device_type == "airplay"]
+        """Get all AirPlay virtual devices (shared snapshot, do not modify)."""
+        if self._airplay_list is None:
+            # _airplay_map holds exactly the AirPlay devices, in creation order
+            self._airplay_list = [self._devices[device_id] for device_id in self._airplay_map.values()]
+        return self._airplay_list
 
     def get_server_speaker_device(self) -> Optional[VirtualDevice]:
         """Get the Server Speaker virtual device."""
-        for d in self._devices.values():
-            if d.device_type == "server_speaker":
-                return d
+        if self._server_speaker_id:
+            return self._devices.get(self._server_speaker_id)
         return None
 
     def get_connected_devices(self) -> List[VirtualDevice]:
@@ -330,13 +547,13 @@ class DeviceManager:
 
     def _load_device_config(self, device: VirtualDevice):
         """Load saved DSP configuration for a device."""
-        saved_config = config_store.get_device_config(device.device_id)
+        saved_config = self._saved_configs.get(device.device_id)
         if saved_config:
             device.dsp_enabled = saved_config.get("dsp_enabled", False)
             saved_dsp = saved_config.get("dsp_config", {})
             if saved_dsp:
                 device.dsp_config.update(saved_dsp)
-            log_info("DeviceManager", f"Loaded saved DSP config for: {device.device_name}")
+            logger.info(f"Loaded saved DSP config for: {device.device_name}")
 
     def to_dict(self) -> List[Dict[str, Any]]:
         """Convert all devices to dictionary list for JSON serialization."""
@@ -8,25 +8,35 @@ This is the central component of the system. Each VirtualDevice:
 - Subscribes to command events and executes them
 - Publishes state change events
 """
+import functools
 import hashlib
+import operator
+import sys
 import uuid
 import time
-import copy
 import asyncio
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, TYPE_CHECKING
 
-from core.event_bus import event_bus
+from core.event_bus import event_bus, media_bus
 from core.events import (
     EventType, Event,
     state_changed, dsp_changed, volume_changed, metadata_updated
 )
 from core.utils import log_info, log_debug, log_warning, log_error
 from config import DEFAULT_DSP_CONFIG, DEVICE_SUFFIX, SERVER_SPEAKER_NAME
+from output.protocols import ReconnectableOutput
 
 if TYPE_CHECKING:
     from output.base import BaseOutput
     from enhancer.base import BaseEnhancer
+    from device.airplay_scanner import DiscoveredDevice
+
+
+@functools.lru_cache(maxsize=256)
+def _airplay_device_id(airplay_id: str) -> str:
+    """Device ID for an AirPlay identifier (memoized, devices are re-seen on every reconnect)"""
+    return hashlib.md5(airplay_id.encode()).hexdigest()[:16]
 
 
 def generate_device_id(airplay_id: Optional[str] = None, device_type: str = "airplay") -> str:
@@ -43,12 +53,53 @@ def generate_device_id(airplay_id: Optional[str] = None, device_type: str = "air
     if device_type == "server_speaker":
         return "server_speaker"
     elif airplay_id:
-        return hashlib.md5(airplay_id.encode()).hexdigest()[:16]
+        return _airplay_device_id(airplay_id)
     else:
         return str(uuid.uuid4())[:16]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class OutputCaps:
+    """Optional interfaces an output implements, probed once when it is attached"""
+    reconnect: bool = False
+    get_current_position: bool = False
+    cleanup: bool = False
+
+    @classmethod
+    def probe(cls, output: Optional["BaseOutput"]) -> "OutputCaps":
+        """Probe an output instance (all False for None)"""
+        if output is None:
+            return NO_OUTPUT_CAPS
+        return cls(
+            reconnect=isinstance(output, ReconnectableOutput),
+            get_current_position=hasattr(output, 'get_current_position'),
+            cleanup=hasattr(output, 'cleanup'),
+        )
+
+
+NO_OUTPUT_CAPS = OutputCaps()
+
+
+def _default_dsp_config() -> Dict[str, Any]:
+    """Fresh copy of the default DSP config (it is flat, a shallow copy is enough)"""
+    return dict(DEFAULT_DSP_CONFIG)
+
+
+# Default for event data lookups that must tell a missing key from a None value
+_MISSING = object()
+
+# Fields serialized by VirtualDevice.to_dict(), in output order
+_TO_DICT_KEYS = (
+    "device_id", "device_name", "device_type", "airplay_id", "airplay_address",
+    "airplay_model", "channel_mode", "group_id", "play_state", "play_url",
+    "play_title", "play_artist", "play_album", "play_cover_url", "play_duration",
+    "play_position", "audio_format", "audio_bitrate", "audio_sample_rate", "audio_channels",
+    "dsp_enabled", "dsp_config", "volume", "muted", "connected",
+)
+_TO_DICT_GETTER = operator.attrgetter(*_TO_DICT_KEYS)
+
+
+@dataclass(slots=True, weakref_slot=True)
 class VirtualDevice:
     """
     Virtual DLNA device - Core executor component.
@@ -85,7 +136,7 @@ class VirtualDevice:
     play_cover_url: str = ""
     play_duration: float = 0.0
     play_position: float = 0.0
-    play_start_time: float = 0.0
+    play_start_time: float = 0.0  # time.monotonic() when playback (re)started, 0 when not playing
 
     # Audio info
     audio_format: str = ""
@@ -96,7 +147,7 @@ class VirtualDevice:
 
     # DSP configuration
     dsp_enabled: bool = False
-    dsp_config: Dict[str, Any] = field(default_factory=lambda: copy.deepcopy(DEFAULT_DSP_CONFIG))
+    dsp_config: Dict[str, Any] = field(default_factory=_default_dsp_config)
 
     # Volume
     volume: int = 100
@@ -104,7 +155,7 @@ class VirtualDevice:
 
     # Connection state
     connected: bool = False
-    last_seen: float = field(default_factory=time.time)
+    last_seen: float = field(default_factory=time.monotonic)  # time.monotonic() of the last command
 
     # DLNA service info
     dlna_uuid: str = field(default_factory=lambda: f"uuid:dlna-bridge-{uuid.uuid4().hex[:8]}")
@@ -116,6 +167,7 @@ class VirtualDevice:
 
     # Internal components (not serialized)
     _output: Optional["BaseOutput"] = field(default=None, repr=False)
+    _output_caps: OutputCaps = field(default=NO_OUTPUT_CAPS, repr=False)
     _enhancer: Optional["BaseEnhancer"] = field(default=None, repr=False)
     _subscribed: bool = field(default=False, repr=False)
 
@@ -133,20 +185,20 @@ class VirtualDevice:
     # ===== Factory Methods =====
 
     @classmethod
-    def create_airplay_device(cls, airplay_info: Dict[str, Any]) -> "VirtualDevice":
+    def create_airplay_device(cls, airplay_info: "DiscoveredDevice") -> "VirtualDevice":
         """Create a virtual device from AirPlay device info."""
-        name = airplay_info.get("name", "Unknown")
+        name = airplay_info.name or "Unknown"
         if isinstance(name, str):
             name = name.strip()
             
-        airplay_id = airplay_info.get("identifier")
+        airplay_id = airplay_info.identifier
         return cls(
-            device_id=generate_device_id(airplay_id, "airplay"),
+            device_id=sys.intern(generate_device_id(airplay_id, "airplay")),
             device_name=f"{name} {DEVICE_SUFFIX}",
             device_type="airplay",
             airplay_id=airplay_id,
-            airplay_address=airplay_info.get("address"),
-            airplay_model=airplay_info.get("model"),
+            airplay_address=airplay_info.address,
+            airplay_model=airplay_info.model,
         )
 
     @classmethod
@@ -190,26 +242,34 @@ class VirtualDevice:
 
     def _on_cmd_play(self, event: Event):
         """Handle play command"""
-        url = event.data.get("url")
-        position = event.data.get("position", 0.0)  # Extract position, default to 0
+        # One lookup per key (metadata keys are only present when the sender provided them)
+        get = event.data.get
+        url = get("url")
+        position = get("position", 0.0)  # Extract position, default to 0
+        trace_id = event.trace_id
 
         if not url:
-            log_warning("VirtualDevice", f"[{event.trace_id}] Play command without URL: {self.device_name}")
+            log_warning("VirtualDevice", f"[{trace_id}] Play command without URL: {self.device_name}")
             return
 
         # Update metadata if provided
-        if "title" in event.data:
-            self.play_title = event.data.get("title", "")
-        if "artist" in event.data:
-            self.play_artist = event.data.get("artist", "")
-        if "album" in event.data:
-            self.play_album = event.data.get("album", "")
-        if "cover_url" in event.data:
-            self.play_cover_url = event.data.get("cover_url", "")
-        if "duration" in event.data:
-            self.play_duration = event.data.get("duration", 0.0)
-
-        self._execute_play(url, position, event.trace_id)
+        title = get("title", _MISSING)
+        if title is not _MISSING:
+            self.play_title = title
+        artist = get("artist", _MISSING)
+        if artist is not _MISSING:
+            self.play_artist = artist
+        album = get("album", _MISSING)
+        if album is not _MISSING:
+            self.play_album = album
+        cover_url = get("cover_url", _MISSING)
+        if cover_url is not _MISSING:
+            self.play_cover_url = cover_url
+        duration = get("duration", _MISSING)
+        if duration is not _MISSING:
+            self.play_duration = duration
+
+        self._execute_play(url, position, trace_id)
 
     def _on_cmd_stop(self, event: Event):
         """Handle stop command"""
@@ -259,15 +319,14 @@ class VirtualDevice:
         self.play_url = url
         self.play_state = "PLAYING"
         self.play_position = position
-        self.play_start_time = time.time()
-        self.last_seen = time.time()
+        self.play_start_time = self.last_seen = time.monotonic()
 
         # Execute via output (pass position for seeking)
         if self._output:
             self._output.handle_action("play", uri=url, position=position)
 
         # Publish state changed event
-        event_bus.publish(state_changed(
+        media_bus.publish_batched(state_changed(
             self.device_id,
             state="PLAYING",
             url=url
@@ -280,39 +339,40 @@ class VirtualDevice:
         self.play_state = "STOPPED"
         self.play_position = 0.0
         self.play_start_time = 0.0
-        self.last_seen = time.time()
+        self.last_seen = time.monotonic()
 
         if self._output:
             self._output.handle_action("stop")
 
-        event_bus.publish(state_changed(self.device_id, state="STOPPED"))
+        media_bus.publish_batched(state_changed(self.device_id, state="STOPPED"))
 
     def _execute_pause(self, trace_id: str = "--------"):
         """Execute pause command"""
         log_info("VirtualDevice", f"[{trace_id}] Pause: {self.device_name}")
 
         # Save current position
+        now = time.monotonic()
         if self.play_state == "PLAYING" and self.play_start_time > 0:
-            elapsed = time.time() - self.play_start_time
-            self.play_position += elapsed
+            self.play_position += now - self.play_start_time
 
         self.play_state = "PAUSED_PLAYBACK"
         self.play_start_time = 0.0
-        self.last_seen = time.time()
+        self.last_seen = now
 
         if self._output:
             self._output.handle_action("pause")
 
-        event_bus.publish(state_changed(self.device_id, state="PAUSED_PLAYBACK"))
+        media_bus.publish_batched(state_changed(self.device_id, state="PAUSED_PLAYBACK"))
 
     def _execute_seek(self, position: float, trace_id: str = "--------"):
         """Execute seek command"""
         log_info("VirtualDevice", f"[{trace_id}] Seek: {self.device_name} position={position}s")
 
+        now = time.monotonic()
         self.play_position = position
         if self.play_state == "PLAYING":
-            self.play_start_time = time.time()
-        self.last_seen = time.time()
+            self.play_start_time = now
+        self.last_seen = now
 
         if self._output:
             self._output.handle_action("seek", position=position)
@@ -346,27 +406,33 @@ class VirtualDevice:
         log_info("VirtualDevice", f"[{trace_id}] DSP: {self.device_name} enabled={enabled}")
 
         # Publish DSP changed event (ConfigStore will save it)
-        event_bus.publish(dsp_changed(self.device_id, enabled, self.dsp_config))
+        media_bus.publish(dsp_changed(self.device_id, enabled, self.dsp_config))
 
     def _execute_reset_dsp(self, trace_id: str = "--------"):
         """Execute reset DSP command"""
         self.dsp_enabled = False
-        self.dsp_config = copy.deepcopy(DEFAULT_DSP_CONFIG)
+        self.dsp_config = _default_dsp_config()
 
         log_info("VirtualDevice", f"[{trace_id}] DSP Reset: {self.device_name}")
 
-        event_bus.publish(dsp_changed(self.device_id, False, self.dsp_config))
+        media_bus.publish(dsp_changed(self.device_id, False, self.dsp_config))
 
     # ===== Output Management =====
 
     def set_output(self, output: "BaseOutput"):
         """Set output instance"""
         self._output = output
+        self._output_caps = OutputCaps.probe(output)
 
     def get_output(self) -> Optional["BaseOutput"]:
         """Get output instance"""
         return self._output
 
+    @property
+    def output_caps(self) -> OutputCaps:
+        """Optional methods implemented by the current output"""
+        return self._output_caps
+
     def set_enhancer(self, enhancer: "BaseEnhancer"):
         """Set DSP enhancer"""
         self._enhancer = enhancer
@@ -403,13 +469,14 @@ class VirtualDevice:
         if duration is not None:
             self.play_duration = duration
 
+        now = time.monotonic()
         if state == "PLAYING":
-            self.play_start_time = time.time()
+            self.play_start_time = now
         elif state == "STOPPED":
             self.play_position = 0.0
             self.play_start_time = 0.0
 
-        self.last_seen = time.time()
+        self.last_seen = now
 
     def update_audio_info(
         self,
@@ -452,7 +519,7 @@ class VirtualDevice:
     def get_current_position(self) -> float:
         """Get current playback position in seconds"""
         # Try to get actual position from Output instance
-        if self._output and hasattr(self._output, 'get_current_position'):
+        if self._output and self._output_caps.get_current_position:
             try:
                 return self._output.get_current_position()
             except:
@@ -460,7 +527,7 @@ class VirtualDevice:
 
         # Fallback to theoretical position calculation
         if self.play_state == "PLAYING" and self.play_start_time > 0:
-            elapsed = time.time() - self.play_start_time
+            elapsed = time.monotonic() - self.play_start_time
             return self.play_position + elapsed
         return self.play_position
 
@@ -468,7 +535,7 @@ class VirtualDevice:
         """Set playback position (for seek operations)"""
         self.play_position = position
         if self.play_state == "PLAYING":
-            self.play_start_time = time.time()
+            self.play_start_time = time.monotonic()
 
     # ===== Lifecycle =====
 
@@ -483,9 +550,10 @@ class VirtualDevice:
         self.unsubscribe_events()
 
         if self._output:
-            if hasattr(self._output, 'cleanup'):
+            if self._output_caps.cleanup:
                 self._output.cleanup()
             self._output = None
+            self._output_caps = NO_OUTPUT_CAPS
 
         log_info("VirtualDevice", f"Shutdown: {self.device_name}")
 
@@ -493,33 +561,10 @@ class VirtualDevice:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            "device_id": self.device_id,
-            "device_name": self.device_name,
-            "device_type": self.device_type,
-            "airplay_id": self.airplay_id,
-            "airplay_address": self.airplay_address,
-            "airplay_model": self.airplay_model,
-            "channel_mode": self.channel_mode,
-            "group_id": self.group_id,
-            "play_state": self.play_state,
-            "play_url": self.play_url,
-            "play_title": self.play_title,
-            "play_artist": self.play_artist,
-            "play_album": self.play_album,
-            "play_cover_url": self.play_cover_url,
-            "play_duration": self.play_duration,
-            "play_position": self.get_current_position(),
-            "audio_format": self.audio_format,
-            "audio_bitrate": self.audio_bitrate,
-            "audio_sample_rate": self.audio_sample_rate,
-            "audio_channels": self.audio_channels,
-            "dsp_enabled": self.dsp_enabled,
-            "dsp_config": self.dsp_config,
-            "volume": self.volume,
-            "muted": self.muted,
-            "connected": self.connected,
-        }
+        data = dict(zip(_TO_DICT_KEYS, _TO_DICT_GETTER(self)))
+        # Live position rather than the one stored at the last state change
+        data["play_position"] = self.get_current_position()
+        return data
 
     # ===== Utility Methods =====
 
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 from config import SAMPLE_RATE
+from core.ffmpeg_utils import s16_to_f32, f32_to_s16
 
 
 class BaseEnhancer(ABC):
@@ -26,6 +27,26 @@ class BaseEnhancer(ABC):
         """
         pass
 
+    def supports_s16(self) -> bool:
+        """Whether enhance_s16() runs natively on int16 with the current settings (a fast-path hint)"""
+        return False
+
+    def enhance_s16(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Enhance int16 PCM
+
+        The default converts to float32, runs enhance() and converts back.
+
+        Args:
+            audio: shape (samples, channels), dtype int16, left unmodified
+
+        Returns:
+            Enhanced audio with same shape and dtype (audio itself when nothing changes)
+        """
+        samples = s16_to_f32(np.ascontiguousarray(audio)).reshape(audio.shape)
+        enhanced = self.enhance(samples)
+        return np.frombuffer(f32_to_s16(enhanced), dtype=np.int16).reshape(audio.shape)
+
     @abstractmethod
     def set_params(self, **kwargs):
         """Set enhancement parameters"""
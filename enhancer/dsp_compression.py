@@ -8,6 +8,44 @@ import numpy as np
 
 from core.utils import log
 
+# numba is optional, JIT-compiles the compressor loop when available
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+    # One pass over the samples instead of one per NumPy op; compiled at import and cached on disk
+    @numba.njit(numba.void(numba.float32[::1], numba.float32, numba.float32, numba.float32, numba.float32),
+                cache=True, fastmath=True)
+    def _compress_kernel(samples, threshold, makeup, slope, offset):
+        for i in range(samples.size):
+            x = samples[i]
+            a = abs(x)
+            if a > threshold:
+                a = a * slope + offset
+            else:
+                a *= makeup
+            if a > 1.0:
+                a = 1.0
+            samples[i] = a if x >= 0 else -a
+
+    # Same curve on int16 PCM with Q16 fixed-point constants, int64 intermediates avoid overflow
+    @numba.njit(numba.void(numba.int16[::1], numba.int64, numba.int64, numba.int64, numba.int64),
+                cache=True)
+    def _compress_kernel_i16(samples, threshold, makeup_q16, slope_q16, offset):
+        for i in range(samples.size):
+            x = numba.int64(samples[i])
+            a = abs(x)
+            if a > threshold:
+                a = ((a * slope_q16) >> 16) + offset
+            else:
+                a = (a * makeup_q16) >> 16
+            if a > 32767:
+                a = 32767
+            samples[i] = a if x >= 0 else -a
+
 
 class DynamicCompressor:
     """
@@ -36,6 +74,13 @@ class DynamicCompressor:
         self.ratio = ratio
         self.makeup_gain = makeup_gain
         self.enabled = False
+        self._update_constants()
+
+        # Scratch buffers reused across process() calls, reallocated when the block shape changes
+        self._magnitude = None
+        self._compressed = None
+        self._magnitude_i = None
+        self._compressed_i = None
 
         log("DSP", "Dynamic Compressor initialized")
 
@@ -54,6 +99,25 @@ class DynamicCompressor:
             self.ratio = ratio
         if makeup_gain is not None:
             self.makeup_gain = makeup_gain
+        self._update_constants()
+
+    def _update_constants(self):
+        """
+        Fold the parameters into the output curve used by process()
+
+        Above threshold the output magnitude is
+        (threshold + (|x| - threshold) / ratio) * makeup = |x| * slope + offset,
+        below it |x| * makeup, so the per-sample work is one multiply-add.
+        """
+        inv_ratio = 1.0 / self.ratio
+        self._slope = inv_ratio * self.makeup_gain
+        self._offset = self.threshold * (1.0 - inv_ratio) * self.makeup_gain
+
+        # Fixed-point versions for process_i16(): threshold and offset in int16 units, gains in Q16
+        self._threshold_i = int(self.threshold * 32767)
+        self._makeup_q16 = int(round(self.makeup_gain * 65536))
+        self._slope_q16 = int(round(self._slope * 65536))
+        self._offset_i = int(round(self._offset * 32767))
 
     def set_enabled(self, enabled: bool):
         """Enable or disable compression"""
@@ -63,35 +127,83 @@ class DynamicCompressor:
         """
         Apply dynamic range compression
 
+        The block is processed in place, using scratch buffers kept between calls.
+
         Args:
-            audio: Input audio of shape (n_samples, channels)
+            audio: Input audio of shape (n_samples, channels), float
 
         Returns:
-            Compressed audio of same shape
+            Compressed audio of same shape (the input array)
         """
         if not self.enabled:
             return audio
 
-        threshold = self.threshold
-        ratio = self.ratio
-        makeup = self.makeup_gain
+        if numba is not None and audio.dtype == np.float32 and audio.flags.c_contiguous:
+            _compress_kernel(audio.reshape(-1), self.threshold, self.makeup_gain, self._slope, self._offset)
+            return audio
 
-        abs_audio = np.abs(audio)
+        if self._magnitude is None or self._magnitude.shape != audio.shape or self._magnitude.dtype != audio.dtype:
+            self._magnitude = np.empty_like(audio)
+            self._compressed = np.empty_like(audio)
+        magnitude = self._magnitude
+        compressed = self._compressed
 
-        # Apply compression to samples above threshold
-        compressed = np.where(
-            abs_audio > threshold,
-            threshold + (abs_audio - threshold) / ratio,
-            abs_audio
-        )
+        # Output magnitude: |x| * slope + offset above threshold, |x| * makeup below.
+        # For ratio >= 1 the compressed line lies below the uncompressed one above threshold
+        # and above it below, so min() picks the right one
+        np.abs(audio, out=magnitude)
+        np.multiply(magnitude, self._slope, out=compressed)
+        np.add(compressed, self._offset, out=compressed)
+        np.multiply(magnitude, self.makeup_gain, out=magnitude)
+        np.minimum(magnitude, compressed, out=magnitude)
 
-        # Restore sign and apply makeup gain
-        result = np.sign(audio) * compressed * makeup
+        # Clip, then restore the sign in one pass (copysign keeps 0 at 0)
+        np.minimum(magnitude, 1.0, out=magnitude)
+        np.copysign(magnitude, audio, out=audio)
 
-        # Clip to prevent clipping
-        result = np.clip(result, -1.0, 1.0)
+        return audio
+
+    def process_i16(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Apply dynamic range compression to int16 PCM
+
+        Same curve as process() on the int16 samples (fixed point with numba),
+        so callers holding S16LE data skip the float conversion. Output is
+        within one LSB of the float path.
+        The block is processed in place.
+
+        Args:
+            audio: Input audio of shape (n_samples, channels), int16
+
+        Returns:
+            Compressed audio of same shape (the input array)
+        """
+        if not self.enabled:
+            return audio
+
+        if numba is not None and audio.flags.c_contiguous:
+            _compress_kernel_i16(audio.reshape(-1), self._threshold_i, self._makeup_q16,
+                                 self._slope_q16, self._offset_i)
+            return audio
 
-        return result
+        # Without numba, float32 scratch is cheaper than int64 (int16 magnitudes are exact in it)
+        if self._magnitude_i is None or self._magnitude_i.shape != audio.shape:
+            self._magnitude_i = np.empty(audio.shape, dtype=np.float32)
+            self._compressed_i = np.empty(audio.shape, dtype=np.float32)
+        magnitude = self._magnitude_i
+        compressed = self._compressed_i
+
+        np.abs(audio, out=magnitude, dtype=np.float32)
+        np.multiply(magnitude, self._slope, out=compressed)
+        np.add(compressed, self._offset_i, out=compressed)
+        np.multiply(magnitude, self.makeup_gain, out=magnitude)
+        np.minimum(magnitude, compressed, out=magnitude)
+        np.minimum(magnitude, 32767.0, out=magnitude)
+
+        # Restore the sign, then truncate back into the int16 block like f32_to_s16 does
+        np.copysign(magnitude, audio, out=magnitude, dtype=np.float32)
+        np.copyto(audio, magnitude, casting="unsafe")
+        return audio
 
     def get_params(self) -> dict:
         """Get current parameters"""
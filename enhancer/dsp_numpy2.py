@@ -115,6 +115,20 @@ class NumpyEnhancer(BaseEnhancer):
 
         return result.astype(np.float32)
 
+    def supports_s16(self) -> bool:
+        """EQ and stereo stages are float-only, compression alone runs on int16"""
+        if self.eq_enabled and self._get_current_processor() is not None:
+            return False
+        return not self._stereo.enabled
+
+    def enhance_s16(self, audio: np.ndarray) -> np.ndarray:
+        """Compression-only pipeline on int16 PCM, falls back to the float pipeline otherwise"""
+        if not self.supports_s16():
+            return super().enhance_s16(audio)
+        if not self._compressor.enabled:
+            return audio
+        return self._compressor.process_i16(audio.copy())
+
     def set_params(self, **kwargs):
         """Set enhancement parameters"""
         # Mode selection
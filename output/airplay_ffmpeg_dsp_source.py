@@ -25,11 +25,11 @@ from pyatv.protocols.raop.audio_source import AudioSource
 from pyatv.interface import MediaMetadata
 
 from core.utils import log_info, log_debug, log_warning, log_error
-from core.event_bus import event_bus
+from core.event_bus import media_bus
 from core.events import state_changed
 from core.ffmpeg_downloader import FFmpegDownloader, DownloaderConfig
 from core.ffmpeg_decoder import FFmpegDecoder, DecoderConfig
-from core.ffmpeg_utils import PCMFormat
+from core.ffmpeg_utils import PCMFormat, f32_to_s16
 from config import SAMPLE_RATE, CHANNELS, MIN_CACHE_SIZE
 
 if TYPE_CHECKING:
@@ -43,9 +43,10 @@ CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cache")
 MIN_CACHE_BYTES = MIN_CACHE_SIZE * 1024
 
 
-def _to_audio_samples(data: bytes) -> bytes:
+def _to_audio_samples(data) -> bytes:
     """Convert PCM bytes to the format expected by pyatv (with byteswap on little-endian systems)."""
-    output = array.array("h", data)
+    output = array.array("h")
+    output.frombytes(data)
     if sys.byteorder == "little":
         output.byteswap()
     return output.tobytes()
@@ -239,7 +240,7 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
             except Exception as e:
                 log_warning(self._tag, f"[{self._device_name_str}] Failed to set DSP params: {e}")
 
-    def _apply_dsp(self, pcm_data: bytes) -> bytes:
+    def _apply_dsp(self, pcm_data):
         """Apply DSP processing to PCM data."""
         # Check if DSP is enabled (read from device for live updates)
         if self._device and not self._device.dsp_enabled:
@@ -255,18 +256,23 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
             except Exception:
                 pass
 
-        # Convert s16le bytes to numpy float32 array
-        samples = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32)
-        samples = samples / 32768.0  # Normalize to [-1, 1]
-        samples = samples.reshape(-1, self._channels)
+        # Compression-only settings run on the int16 samples directly
+        if self._enhancer.supports_s16():
+            samples = np.frombuffer(pcm_data, dtype=np.int16).reshape(-1, self._channels)
+            enhanced = self._enhancer.enhance_s16(samples)
+            # Nothing enabled, pass the block through without copying it
+            if enhanced is samples:
+                return pcm_data
+            return enhanced.tobytes()
+
+        # Convert s16le bytes to numpy float32 array normalized to [-1, 1]
+        samples = PCMFormat.S16LE.to_f32(pcm_data).reshape(-1, self._channels)
 
         # Apply enhancement
         enhanced = self._enhancer.enhance(samples)
 
-        # Convert back to s16le
-        enhanced = np.clip(enhanced, -1.0, 1.0)
-        enhanced = (enhanced * 32767).astype(np.int16)
-        return enhanced.tobytes()
+        # Clip and convert back to s16le
+        return f32_to_s16(enhanced)
 
     async def readframes(self, nframes: int) -> str | bytes:
         """
@@ -282,7 +288,7 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
 
         if not self._started:
             # Run blocking download/decoder start in executor
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None, self._start_download_and_decoder
             )
 
@@ -293,15 +299,16 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
             return AudioSource.NO_FRAMES
 
         # Calculate bytes needed
-        bytes_per_frame = self._channels * self.SAMPLE_SIZE
+        bytes_per_frame = self._decoder.bytes_per_frame
         bytes_needed = nframes * bytes_per_frame
 
         # Read from decoder (in executor to not block event loop)
         try:
             def read_data():
-                return self._decoder.read(bytes_needed)
+                # Reused decoder buffer, the data is copied by _apply_dsp / _to_audio_samples
+                return self._decoder.read_into(bytes_needed)
 
-            pcm_data = await asyncio.get_event_loop().run_in_executor(None, read_data)
+            pcm_data = await asyncio.get_running_loop().run_in_executor(None, read_data)
 
             if not pcm_data:
                 self._eof = True
@@ -314,7 +321,7 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
                 log_debug(self._tag, f"[{device_name}] First audio data received")
 
                 try:
-                    await event_bus.publish_async(
+                    await media_bus.publish_async(
                         state_changed(self._device.device_id, state=self._device.play_state)
                     )
                 except Exception as e:
@@ -328,7 +335,7 @@ class AirPlayFFmpegDspAudioSource(AudioSource):
                     log_warning(self._tag, f"[{self._device_name_str}] DSP error: {e}")
 
             # Track sent frames
-            actual_frames = len(pcm_data) // (self._channels * self.SAMPLE_SIZE)
+            actual_frames = len(pcm_data) // bytes_per_frame
             self._total_frames_sent += actual_frames
 
             # Convert to format expected by pyatv (byteswap on little-endian systems)
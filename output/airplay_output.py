@@ -16,10 +16,11 @@ from pyatv.const import Protocol
 from pyatv.interface import MediaMetadata
 
 from core.utils import log_info, log_debug, log_warning, log_error
-from core.event_bus import event_bus
+from core.event_bus import media_bus
 from core.events import state_changed
 from config import SAMPLE_RATE, CHANNELS, AIRPLAY_SCAN_TIMEOUT
 from .base import BaseOutput
+from .protocols import ReconnectableOutput
 from .airplay_ffmpeg_dsp_source import AirPlayFFmpegDspAudioSource
 
 if TYPE_CHECKING:
@@ -27,7 +28,7 @@ if TYPE_CHECKING:
     from enhancer.base import BaseEnhancer
 
 
-class AirPlayOutput(BaseOutput):
+class AirPlayOutput(BaseOutput, ReconnectableOutput):
     """
     AirPlay audio output bound to a specific virtual device.
 
@@ -94,7 +95,7 @@ class AirPlayOutput(BaseOutput):
 
             # Scan for target device
             atvs = await pyatv.scan(
-                loop=self._loop or asyncio.get_event_loop(),
+                loop=self._loop or asyncio.get_running_loop(),
                 timeout=AIRPLAY_SCAN_TIMEOUT,
                 protocol=Protocol.AirPlay,
             )
@@ -323,7 +324,7 @@ class AirPlayOutput(BaseOutput):
 
             # Notify playback completed
             self._device.play_state = "STOPPED"
-            await event_bus.publish_async(state_changed(self._device.device_id, state="STOPPED"))
+            await media_bus.publish_async(state_changed(self._device.device_id, state="STOPPED"))
 
         except asyncio.CancelledError:
             log_debug("AirPlayOutput", "Stream cancelled")
@@ -384,8 +385,11 @@ class AirPlayOutput(BaseOutput):
         await self.stop()
 
         if self._atv:
-            self._atv.close()
+            # pyatv hands back the tasks still tearing the connection down
+            pending = self._atv.close()
             self._atv = None
+            if pending:
+                await asyncio.wait(pending, timeout=2.0)
 
         self._device.connected = False
         log_debug("AirPlayOutput", f"{self._device.device_name}: Disconnected")
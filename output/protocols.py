@@ -0,0 +1,28 @@
+"""
+Output protocols - Optional interfaces an output can implement on top of BaseOutput
+"""
+import asyncio
+from typing import Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ReconnectableOutput(Protocol):
+    """
+    Output holding a device connection on its own event loop.
+
+    The device manager re-establishes the connection through this interface
+    when the device is discovered again after being lost.
+    """
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the connection lives on (None until started)"""
+        ...
+
+    async def connect(self) -> bool:
+        """Connect to the device, True on success"""
+        ...
+
+    async def disconnect(self):
+        """Close the connection, returning once it has finished closing"""
+        ...
@@ -20,7 +20,7 @@ import numpy as np
 import sounddevice as sd
 
 from core.utils import log_info, log_debug, log_warning, log_error
-from core.event_bus import event_bus
+from core.event_bus import media_bus
 from core.events import state_changed
 from core.ffmpeg_downloader import FFmpegDownloader, DownloaderConfig
 from core.ffmpeg_decoder import FFmpegDecoder, DecoderConfig
@@ -226,7 +226,7 @@ class ServerSpeakerOutput:
 
         while self._is_playing and self._decoder.is_running:
             try:
-                data = self._decoder.read(self._chunk_bytes)
+                data = self._decoder.read_into(self._chunk_bytes)
                 if not data:
                     log_info("ServerSpeaker", f"{device_name}: Decoder stream ended")
                     # Notify playback completed
@@ -234,7 +234,7 @@ class ServerSpeakerOutput:
                         if self._event_loop and self._event_loop.is_running():
                             self._device.play_state = "STOPPED"
                             asyncio.run_coroutine_threadsafe(
-                                event_bus.publish_async(state_changed(self._device.device_id, state="STOPPED")),
+                                media_bus.publish_async(state_changed(self._device.device_id, state="STOPPED")),
                                 self._event_loop
                             )
                     except Exception as e:
@@ -248,7 +248,7 @@ class ServerSpeakerOutput:
                     try:
                         if self._event_loop and self._event_loop.is_running():
                             asyncio.run_coroutine_threadsafe(
-                                event_bus.publish_async(state_changed(self._device.device_id, state=self._device.play_state)),
+                                media_bus.publish_async(state_changed(self._device.device_id, state=self._device.play_state)),
                                 self._event_loop
                             )
                     except Exception as e:
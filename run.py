@@ -20,6 +20,8 @@ import sys
 from typing import Optional
 
 from core.utils import log_info, set_log_level, LOG_LEVEL_DEBUG, LOG_LEVEL_INFO
+from core.event_bus import event_bus
+from core.events import system_shutdown
 from core.ffmpeg_checker import check_ffmpeg_or_exit
 from config import APP_NAME, APP_VERSION, DEBUG
 
@@ -59,22 +61,25 @@ class UnAirplay:
         self._running = False
 
         # Set output factory for device manager
-        self._device_manager.set_output_factory(self._create_output_for_device)
+        self._device_manager.set_output_factory(self._create_output_for_device, enhancer_factory=ScipyEnhancer)
 
     def _create_output_for_device(self, device: VirtualDevice):
         """
         Create and attach output to a virtual device.
 
-        This is called by DeviceManager when a new device is created.
+        This is called by DeviceManager on its loop when a new device is created,
+        after the DSP enhancer has been built in the executor.
 
         Args:
             device: Virtual device that needs an output
         """
         log_info("Bridge", f"Creating output for: {device.device_name} (type: {device.device_type})")
 
-        # Create DSP enhancer
-        enhancer = ScipyEnhancer()
-        device.set_enhancer(enhancer)
+        # DSP enhancer (built by the manager, created here if that failed)
+        enhancer = device.get_enhancer()
+        if enhancer is None:
+            enhancer = ScipyEnhancer()
+            device.set_enhancer(enhancer)
 
         # Create output based on device type
         if device.device_type == "airplay":
@@ -96,7 +101,7 @@ class UnAirplay:
 
     async def run(self):
         """Run the main application"""
-        self._loop = asyncio.get_event_loop()
+        self._loop = asyncio.get_running_loop()
         self._running = True
 
         # Print startup banner
@@ -127,6 +132,9 @@ class UnAirplay:
         log_info("Bridge", "Shutting down...")
         self._running = False
 
+        # Notify subscribers (ConfigStore flushes pending changes)
+        event_bus.publish(system_shutdown())
+
         # Stop services
         await self._dlna_service.stop()
         self._device_manager.stop()
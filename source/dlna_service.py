@@ -45,13 +45,13 @@ from typing import Optional, Dict, Any, TYPE_CHECKING
 from xml.sax.saxutils import escape as xml_escape
 
 from core.utils import log_info, log_debug, log_warning, log_error
-from core.event_bus import event_bus
+from core.event_bus import event_bus, media_bus
 from core.events import (
     EventType, Event,
     cmd_play, cmd_stop, cmd_pause, cmd_seek, cmd_set_volume, cmd_set_mute
 )
 from core.ffprobe import probe_media, format_bitrate
-from config import LOCAL_IP, HTTP_PORT, SSDP_MULTICAST_ADDR, SSDP_PORT
+from config import get_local_ip, HTTP_PORT, SSDP_MULTICAST_ADDR, SSDP_PORT
 
 if TYPE_CHECKING:
     from device.device_manager import DeviceManager
@@ -381,7 +381,7 @@ class DLNAService:
         self._subscribers: Dict[str, Dict[str, dict]] = {}
 
         # Subscribe to state change events for UPnP GENA notifications
-        event_bus.subscribe(EventType.STATE_CHANGED, self._on_state_changed)
+        media_bus.subscribe(EventType.STATE_CHANGED, self._on_state_changed)
 
     def _on_state_changed(self, event: Event):
         """
@@ -434,7 +434,7 @@ class DLNAService:
 
     def _build_ssdp_response(self, device: "VirtualDevice", st: str) -> bytes:
         """Build SSDP response for a device"""
-        location = f"http://{LOCAL_IP}:{HTTP_PORT}/device/{device.device_id}/device.xml"
+        location = f"http://{get_local_ip()}:{HTTP_PORT}/device/{device.device_id}/device.xml"
         return (
             "HTTP/1.1 200 OK\r\n"
             f"LOCATION: {location}\r\n"
@@ -448,7 +448,7 @@ class DLNAService:
 
     def _build_notify(self, device: "VirtualDevice", nt: str) -> bytes:
         """Build SSDP NOTIFY for a device"""
-        location = f"http://{LOCAL_IP}:{HTTP_PORT}/device/{device.device_id}/device.xml"
+        location = f"http://{get_local_ip()}:{HTTP_PORT}/device/{device.device_id}/device.xml"
         return (
             "NOTIFY * HTTP/1.1\r\n"
             f"HOST: {SSDP_MULTICAST_ADDR}:{SSDP_PORT}\r\n"
@@ -467,7 +467,7 @@ class DLNAService:
         self._ssdp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._ssdp_socket.bind(("", SSDP_PORT))
 
-        mreq = struct.pack("4s4s", socket.inet_aton(SSDP_MULTICAST_ADDR), socket.inet_aton(LOCAL_IP))
+        mreq = struct.pack("4s4s", socket.inet_aton(SSDP_MULTICAST_ADDR), socket.inet_aton(get_local_ip()))
         self._ssdp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
         self._ssdp_socket.setblocking(False)
 
@@ -479,7 +479,7 @@ class DLNAService:
             "urn:schemas-upnp-org:service:ConnectionManager:1",
         ]
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         log_debug("SSDP", "SSDP listener started")
 
         while self._running:
@@ -1351,7 +1351,7 @@ class DLNAService:
         site = web.TCPSite(self._runner, "0.0.0.0", HTTP_PORT)
         await site.start()
 
-        log_info("DLNAService", f"DLNA service started on http://{LOCAL_IP}:{HTTP_PORT}")
+        log_info("DLNAService", f"DLNA service started on http://{get_local_ip()}:{HTTP_PORT}")
 
     async def stop(self):
         """Stop DLNA service"""
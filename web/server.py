@@ -12,7 +12,7 @@ from aiohttp import web
 from core.utils import log_info
 from core.event_bus import event_bus
 from core.events import cmd_set_dsp, cmd_reset_dsp
-from config import LOCAL_IP, WEB_PORT, DEFAULT_DSP_CONFIG, DEBUG
+from config import get_local_ip, WEB_PORT, DEFAULT_DSP_CONFIG, DEBUG
 from web.server_test import TestAPIRoutes
 
 if TYPE_CHECKING:
@@ -161,4 +161,4 @@ class WebServer:
         await runner.setup()
         site = web.TCPSite(runner, "0.0.0.0", WEB_PORT)
         await site.start()
-        log_info("WebServer", f"Web panel started: http://{LOCAL_IP}:{WEB_PORT}")
+        log_info("WebServer", f"Web panel started: http://{get_local_ip()}:{WEB_PORT}")